@@ -18,7 +18,7 @@ import asyncio
 
 from services.chronicling_america_service import ChroniclingAmericaService
 from services.fulton_history_service import FultonHistoryService
-from services.historical_events_service import HistoricalEventsService
+from services.historical_events_service import get_historical_events_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -26,7 +26,7 @@ router = APIRouter()
 # Initialize services
 chronicling_service = ChroniclingAmericaService()
 fulton_service = FultonHistoryService()
-events_service = HistoricalEventsService()
+events_service = get_historical_events_service()
 
 
 class HistoricalRecord(BaseModel):
@@ -168,7 +168,7 @@ async def initiate_deep_search(
 
         # 3. Search for related historical events
         logger.info("Searching historical events database...")
-        events = await events_service.get_events_for_location(
+        events = events_service.get_events_for_location(
             lat=lat,
             lon=lon,
             municipality=location_parts['city'],
@@ -290,7 +290,7 @@ async def get_long_island_events(
     - economic: Industry changes, significant businesses
     - cultural: Notable residents, landmarks
     """
-    events = await events_service.get_long_island_events(
+    events = events_service.get_long_island_events(
         year_start=year_start,
         year_end=year_end,
         event_type=event_type,
@@ -394,7 +394,7 @@ async def get_location_timeline(
 
     Combines all available data sources into a chronological narrative.
     """
-    timeline = await events_service.build_timeline(
+    timeline = events_service.build_timeline(
         location=location,
         year_start=year_start,
         year_end=year_end
@@ -12,6 +12,7 @@ from typing import Optional, List
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, Query, Response
 from pydantic import BaseModel, Field
+import asyncio
 import httpx
 
 from services.imagery_service import ImageryService
@@ -69,8 +70,12 @@ async def get_available_imagery(
     sorted by date from newest to oldest.
     """
     try:
-        available = await imagery_service.get_available_imagery(lat, lon)
-        usgs_available = await usgs_service.get_available_maps(lat, lon)
+        # NYS orthoimagery probes and the TNM query are independent, so the
+        # response waits for the slower of the two rather than their sum
+        available, usgs_available = await asyncio.gather(
+            imagery_service.get_available_imagery(lat, lon),
+            usgs_service.get_available_maps(lat, lon)
+        )
 
         all_imagery = available + usgs_available
         all_imagery.sort(key=lambda x: x.get('year', 0), reverse=True)
@@ -8,20 +8,21 @@ This module provides access to:
 - Native American territory maps
 """
 
+import gzip
 import logging
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
 
 from services.sanborn_service import SanbornMapService
-from services.historical_basemap_service import HistoricalBasemapService
+from services.historical_basemap_service import get_historical_basemap_service
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 # Initialize services
 sanborn_service = SanbornMapService()
-basemap_service = HistoricalBasemapService()
+basemap_service = get_historical_basemap_service()
 
 
 class MapLayer(BaseModel):
@@ -85,7 +86,7 @@ async def get_available_sanborn_maps(
     Major surveys were conducted 1884-1950.
     """
     try:
-        available = await sanborn_service.get_available_maps(
+        available = sanborn_service.get_available_maps(
             lat=lat,
             lon=lon,
             municipality=municipality
@@ -113,7 +114,7 @@ async def get_sanborn_map_details(map_id: str) -> dict:
     Get detailed information and access URL for a specific Sanborn map.
     """
     try:
-        details = await sanborn_service.get_map_details(map_id)
+        details = sanborn_service.get_map_details(map_id)
 
         if not details:
             raise HTTPException(status_code=404, detail="Sanborn map not found")
@@ -319,18 +320,72 @@ async def get_historical_periods() -> dict:
     }
 
 
+def _accepts_gzip(accept_encoding: Optional[str]) -> bool:
+    """Check whether an Accept-Encoding header allows gzip, honouring q-values."""
+    wildcard = False
+    for coding in (accept_encoding or "").split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+
+        if name in ("gzip", "x-gzip"):
+            return q > 0
+        if name == "*":
+            wildcard = q > 0
+
+    return wildcard
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+
 @router.get("/geojson/{layer_id}")
-async def get_geojson_layer(layer_id: str) -> dict:
+async def get_geojson_layer(
+    layer_id: str,
+    request: Request,
+    z: Optional[int] = Query(None, ge=0, description="Map zoom level to simplify geometry for")
+) -> Response:
     """
     Get GeoJSON data for a historical map layer.
+
+    Layers are static, so the pre-serialized (and pre-compressed) body is
+    returned as-is, and clients revalidating with If-None-Match get a 304.
     """
     try:
-        geojson = await basemap_service.get_geojson_layer(layer_id)
-
-        if not geojson:
+        use_gzip = _accepts_gzip(request.headers.get("accept-encoding"))
+        etag = basemap_service.get_geojson_layer_etag(layer_id, z, compressed=use_gzip)
+        if not etag:
             raise HTTPException(status_code=404, detail=f"Layer not found: {layer_id}")
 
-        return geojson
+        headers = {"Vary": "Accept-Encoding", "ETag": etag}
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers=headers)
+
+        if use_gzip:
+            geojson = basemap_service.get_geojson_layer_gzip(layer_id, z)
+            headers["Content-Encoding"] = "gzip"
+        else:
+            geojson = basemap_service.get_geojson_layer_bytes(layer_id, z)
+
+        return Response(content=geojson, media_type="application/json", headers=headers)
     except HTTPException:
         raise
     except Exception as e:
@@ -338,6 +393,70 @@ async def get_geojson_layer(layer_id: str) -> dict:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/features")
+async def get_features_in_bbox(
+    minx: float = Query(..., description="West longitude"),
+    miny: float = Query(..., description="South latitude"),
+    maxx: float = Query(..., description="East longitude"),
+    maxy: float = Query(..., description="North latitude"),
+    layer_id: Optional[str] = Query(None, description="Limit results to one layer")
+) -> dict:
+    """
+    Get historical map features that intersect a bounding box.
+
+    Useful for loading only the features inside the current map viewport.
+    """
+    if minx > maxx or miny > maxy:
+        raise HTTPException(status_code=400, detail="Invalid bounding box")
+
+    try:
+        features = basemap_service.query_bbox(minx, miny, maxx, maxy, layer_id=layer_id)
+
+        return {
+            "type": "FeatureCollection",
+            "features": features
+        }
+    except Exception as e:
+        logger.error(f"Error querying features: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/tiles/{layer_id}/{z}/{x}/{y}.mvt")
+async def get_vector_tile(layer_id: str, z: int, x: int, y: int, request: Request) -> Response:
+    """
+    Get a Mapbox Vector Tile for a historical map layer.
+
+    Tiles contain only the features visible in that tile, so clients can
+    render large layers without downloading the whole GeoJSON. Tiles are
+    cached gzipped and decompressed for clients that don't accept gzip.
+    """
+    if not (0 <= z <= 22 and 0 <= x < (1 << z) and 0 <= y < (1 << z)):
+        raise HTTPException(status_code=400, detail="Invalid tile coordinates")
+
+    try:
+        tile = basemap_service.get_mvt_tile(layer_id, z, x, y)
+
+        if tile is None:
+            raise HTTPException(status_code=404, detail=f"Layer not found: {layer_id}")
+
+        headers = {"Vary": "Accept-Encoding"}
+        if _accepts_gzip(request.headers.get("accept-encoding")):
+            headers["Content-Encoding"] = "gzip"
+        else:
+            tile = gzip.decompress(tile)
+
+        return Response(
+            content=tile,
+            media_type="application/vnd.mapbox-vector-tile",
+            headers=headers
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error rendering vector tile: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/native-territories")
 async def get_native_territories() -> dict:
     """
@@ -25,6 +25,9 @@ router = APIRouter()
 parcel_service = ParcelService()
 geocoding_service = GeocodingService()
 
+# Upper bound on SBLs accepted by the batch lookup endpoint
+MAX_BATCH_SBLS = 500
+
 
 class ParcelBoundary(BaseModel):
     """GeoJSON representation of parcel boundary."""
@@ -192,6 +195,40 @@ async def search_by_sbl(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/search/sbls")
+async def search_by_sbls(
+    sbl: List[str] = Query(..., description="Section-Block-Lot numbers (repeat the parameter)"),
+    include_boundary: bool = Query(True, description="Include parcel boundaries")
+) -> ParcelSearchResponse:
+    """
+    Search for several parcels by Section-Block-Lot number in one request.
+
+    SBLs may mix Suffolk and Nassau formats; each county is queried in
+    batches rather than once per SBL.
+    """
+    if len(sbl) > MAX_BATCH_SBLS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {MAX_BATCH_SBLS} SBLs per request"
+        )
+
+    try:
+        parcels = await parcel_service.get_parcels_by_sbls(
+            sbls=sbl,
+            include_boundary=include_boundary
+        )
+
+        return ParcelSearchResponse(
+            success=True,
+            message=f"Found {len(parcels)} parcel(s)",
+            results=parcels,
+            total_count=len(parcels)
+        )
+    except Exception as e:
+        logger.error(f"Error searching by SBLs: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.get("/deed-history/{sbl}")
 async def get_deed_history(sbl: str):
     """
@@ -38,8 +38,13 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting Long Island Historical Land Information System...")
 
-    # Initialize cache
-    app.state.cache = CacheManager()
+    # Initialize cache; Redis when REDIS_URL is set, in-memory otherwise
+    redis_url = os.getenv("REDIS_URL")
+    app.state.cache = CacheManager(use_redis=bool(redis_url), redis_url=redis_url)
+
+    # USGS responses are historical and slow to fetch; share them across
+    # workers and restarts through the application cache
+    imagery.usgs_service.cache = app.state.cache
 
     # Warm up connections to external services
     logger.info("Warming up external service connections...")
@@ -49,6 +54,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     await app.state.cache.close()
+    await parcels.parcel_service.aclose()
+    await imagery.imagery_service.aclose()
+    await imagery.usgs_service.aclose()
 
 
 # Create FastAPI application
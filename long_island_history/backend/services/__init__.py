@@ -10,10 +10,10 @@ from .imagery_service import ImageryService
 from .usgs_service import USGSService
 from .chronicling_america_service import ChroniclingAmericaService
 from .fulton_history_service import FultonHistoryService
-from .historical_events_service import HistoricalEventsService
+from .historical_events_service import HistoricalEventsService, get_historical_events_service
 from .ai_synthesis_service import AISynthesisService
 from .sanborn_service import SanbornMapService
-from .historical_basemap_service import HistoricalBasemapService
+from .historical_basemap_service import HistoricalBasemapService, get_historical_basemap_service
 from .cache_manager import CacheManager
 
 __all__ = [
@@ -24,8 +24,10 @@ __all__ = [
     'ChroniclingAmericaService',
     'FultonHistoryService',
     'HistoricalEventsService',
+    'get_historical_events_service',
     'AISynthesisService',
     'SanbornMapService',
     'HistoricalBasemapService',
+    'get_historical_basemap_service',
     'CacheManager'
 ]
@@ -35,6 +35,8 @@ class CacheManager:
             "newspaper": 86400,   # 24 hours - newspaper results don't change
             "geocode": 2592000,   # 30 days - addresses don't move
             "events": 604800,     # 7 days - historical events are static
+            "usgs_maps": 604800,  # 7 days - historical topo catalog rarely changes
+            "usgs_topo": 604800,  # 7 days - same catalog, per-year lookups
             "synthesis": 3600     # 1 hour - AI synthesis may be refined
         }
 
@@ -12,9 +12,15 @@ from typing import Optional, List, Dict, Any
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 import asyncio
+import heapq
+
+from utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+# Title fragments identifying Long Island newspapers
+LI_PAPER_KEYWORDS = ("long-islander", "suffolk", "nassau", "brooklyn")
+
 
 class ChroniclingAmericaService:
     """Service for searching Library of Congress Chronicling America."""
@@ -63,7 +69,9 @@ class ChroniclingAmericaService:
         # Chronicling America coverage ends around 1963
         year_end = min(year_end, 1963)
 
-        all_results = []
+        # Min-heap of (relevance, -arrival, record) holding the best max_results
+        top_results = []
+        seen_ids = set()
 
         # Build search queries
         queries = self._build_search_queries(location, keywords, deep_search)
@@ -75,11 +83,22 @@ class ChroniclingAmericaService:
                     state=state,
                     year_start=year_start,
                     year_end=year_end,
-                    max_results=max_results - len(all_results)
+                    max_results=max_results - len(seen_ids)
                 )
-                all_results.extend(results)
 
-                if len(all_results) >= max_results:
+                # Deduplicate and keep the most relevant results
+                for result in results:
+                    if result["id"] in seen_ids:
+                        continue
+                    seen_ids.add(result["id"])
+
+                    entry = (result["relevance_score"], -len(seen_ids), result)
+                    if len(top_results) < max_results:
+                        heapq.heappush(top_results, entry)
+                    else:
+                        heapq.heappushpop(top_results, entry)
+
+                if len(seen_ids) >= max_results:
                     break
 
                 # Rate limiting - be nice to LOC servers
@@ -88,15 +107,10 @@ class ChroniclingAmericaService:
             except Exception as e:
                 logger.error(f"Search error for query '{query}': {e}")
 
-        # Deduplicate results
-        seen_ids = set()
-        unique_results = []
-        for result in all_results:
-            if result["id"] not in seen_ids:
-                seen_ids.add(result["id"])
-                unique_results.append(result)
+        # Most relevant first, earliest found first on ties
+        top_results.sort(key=lambda entry: entry[:2], reverse=True)
 
-        return unique_results[:max_results]
+        return [result for _, _, result in top_results]
 
     def _build_search_queries(
         self,
@@ -166,7 +180,7 @@ class ChroniclingAmericaService:
                 response = await client.get(self.search_url, params=params)
 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = json_loads(response.content)
                     total_items = data.get("totalItems", 0)
 
                     logger.info(f"Found {total_items} items for query: {query}")
@@ -257,11 +271,8 @@ class ChroniclingAmericaService:
             score += 0.1
 
         # Prefer Long Island newspapers
-        li_papers = ["long-islander", "suffolk", "nassau", "brooklyn"]
-        for paper in li_papers:
-            if paper in title:
-                score += 0.1
-                break
+        if any(paper in title for paper in LI_PAPER_KEYWORDS):
+            score += 0.1
 
         return min(score, 1.0)
 
@@ -18,11 +18,15 @@ import httpx
 from bs4 import BeautifulSoup
 import asyncio
 import re
+from time import monotonic
 from urllib.parse import quote_plus
 from tenacity import retry, stop_after_attempt, wait_exponential
 
 logger = logging.getLogger(__name__)
 
+_DATE_RE = re.compile(r'(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\w+ \d{1,2}, \d{4})')
+_YEAR_RE = re.compile(r'\b(1[789]\d{2}|20[012]\d)\b')
+
 
 class FultonHistoryService:
     """Service for searching FultonHistory (Old Fulton NY Post Cards)."""
@@ -33,7 +37,7 @@ class FultonHistoryService:
 
         # Rate limiting settings - be respectful
         self.min_delay = 2.0  # Minimum seconds between requests
-        self.last_request_time = 0
+        self.last_request_time = 0.0
 
         self.timeout = httpx.Timeout(60.0)
 
@@ -69,6 +73,11 @@ class FultonHistoryService:
             "Oyster Bay Guardian"
         ]
 
+        # Lowercased (match, display) pairs, built once for substring checks
+        self._li_newspapers_lower = tuple(
+            (paper.lower(), paper) for paper in self.li_newspapers
+        )
+
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=2, min=2, max=30))
     async def search(
         self,
@@ -150,14 +159,13 @@ class FultonHistoryService:
 
     async def _rate_limit(self):
         """Implement rate limiting."""
-        import time
-        current_time = time.time()
-        elapsed = current_time - self.last_request_time
+        # Monotonic clock so wall-clock adjustments can't shorten the delay
+        elapsed = monotonic() - self.last_request_time
 
         if elapsed < self.min_delay:
             await asyncio.sleep(self.min_delay - elapsed)
 
-        self.last_request_time = time.time()
+        self.last_request_time = monotonic()
 
     async def _execute_search(
         self,
@@ -229,43 +237,46 @@ class FultonHistoryService:
                            soup.find_all('tr', class_='result') or \
                            soup.find_all('li', class_='result')
 
+            county_lower = county.lower() if county else None
+
             for item in result_items:
-                record = self._parse_result_item(item, query)
+                text = item.get_text(strip=True)
+
+                # Filter by year before doing the full parse
+                year_match = _YEAR_RE.search(text)
+                year = int(year_match.group(1)) if year_match else 0
+                if not (year_start <= year <= year_end):
+                    continue
+
+                record = self._parse_result_item(item, query, text, year)
                 if record:
-                    # Filter by year
-                    if year_start <= record.get("year", 0) <= year_end:
-                        # Filter by county if specified
-                        if county:
-                            if county.lower() in record.get("source_name", "").lower():
-                                results.append(record)
-                        else:
+                    # Filter by county if specified
+                    if county_lower:
+                        if county_lower in record.get("source_name", "").lower():
                             results.append(record)
+                    else:
+                        results.append(record)
 
         except Exception as e:
             logger.error(f"Error parsing FultonHistory results: {e}")
 
         return results
 
-    def _parse_result_item(self, item, query: str) -> Optional[Dict[str, Any]]:
-        """Parse a single result item."""
+    def _parse_result_item(
+        self,
+        item,
+        query: str,
+        text: str,
+        year: int
+    ) -> Optional[Dict[str, Any]]:
+        """Parse a single result item from its pre-extracted text and year."""
         try:
-            # Extract text content
-            text = item.get_text(strip=True)
-
             # Try to extract date
-            date_match = re.search(r'(\d{4}[-/]\d{1,2}[-/]\d{1,2}|\w+ \d{1,2}, \d{4})', text)
+            date_match = _DATE_RE.search(text)
             date = date_match.group(1) if date_match else ""
 
-            # Extract year
-            year_match = re.search(r'\b(1[789]\d{2}|20[012]\d)\b', text)
-            year = int(year_match.group(1)) if year_match else 0
-
             # Try to find newspaper name
-            newspaper = "Unknown Long Island Newspaper"
-            for paper in self.li_newspapers:
-                if paper.lower() in text.lower():
-                    newspaper = paper
-                    break
+            newspaper = self._match_li_newspaper(text.lower()) or "Unknown Long Island Newspaper"
 
             # Get link if available
             link = item.find('a')
@@ -307,13 +318,18 @@ class FultonHistoryService:
             score += 0.1
 
         # Known LI newspaper
-        for paper in self.li_newspapers:
-            if paper.lower() in text_lower:
-                score += 0.1
-                break
+        if self._match_li_newspaper(text_lower):
+            score += 0.1
 
         return min(score, 1.0)
 
+    def _match_li_newspaper(self, text_lower: str) -> Optional[str]:
+        """Return the first known Long Island newspaper named in lowercased text."""
+        for paper_lower, paper in self._li_newspapers_lower:
+            if paper_lower in text_lower:
+                return paper
+        return None
+
     def _deduplicate_results(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Remove duplicate results."""
         seen = set()
@@ -7,13 +7,23 @@ Uses multiple geocoding providers with fallback:
 3. NY State Address Points - when available
 """
 
+import csv
+import io
 import logging
-from typing import Optional, Dict, Any
+import re
+from typing import Optional, List, Dict, Any
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from utils.json_utils import json_loads
+
 logger = logging.getLogger(__name__)
 
+# Census batch geocoder accepts at most this many addresses per upload
+CENSUS_BATCH_LIMIT = 10000
+
+_STATE_ZIP_RE = re.compile(r'^([A-Za-z]{2})(?:\s+(\d{5})(?:-\d{4})?)?$')
+
 
 class GeocodingService:
     """Service for geocoding addresses to coordinates."""
@@ -21,7 +31,9 @@ class GeocodingService:
     def __init__(self):
         self.nominatim_url = "https://nominatim.openstreetmap.org/search"
         self.census_url = "https://geocoding.geo.census.gov/geocoder/locations/onelineaddress"
+        self.census_batch_url = "https://geocoding.geo.census.gov/geocoder/locations/addressbatch"
         self.timeout = httpx.Timeout(15.0)
+        self.batch_timeout = httpx.Timeout(300.0)  # Large batches take minutes
 
         # User agent for Nominatim (required)
         self.headers = {
@@ -66,7 +78,7 @@ class GeocodingService:
                 response = await client.get(self.census_url, params=params)
 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = json_loads(response.content)
                     matches = data.get("result", {}).get("addressMatches", [])
 
                     if matches:
@@ -86,6 +98,83 @@ class GeocodingService:
 
         return None
 
+    async def geocode_addresses_batch(
+        self,
+        addresses: List[str]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Geocode many addresses with the US Census batch geocoder.
+
+        Addresses are uploaded as CSV in chunks of up to 10,000 per request.
+        Returns a list aligned with the input; entries that could not be
+        matched are None.
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(addresses)
+
+        for offset in range(0, len(addresses), CENSUS_BATCH_LIMIT):
+            chunk = addresses[offset:offset + CENSUS_BATCH_LIMIT]
+            matches = await self._geocode_census_batch(chunk)
+
+            for index, match in matches.items():
+                results[offset + index] = match
+
+        return results
+
+    async def _geocode_census_batch(self, addresses: List[str]) -> Dict[int, Dict[str, Any]]:
+        """Upload one CSV batch to the Census geocoder, keyed by input index."""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for index, address in enumerate(addresses):
+            writer.writerow([index, *self._split_address(address)])
+
+        matches = {}
+
+        try:
+            async with httpx.AsyncClient(timeout=self.batch_timeout) as client:
+                response = await client.post(
+                    self.census_batch_url,
+                    files={"addressFile": ("batch.csv", buffer.getvalue(), "text/csv")},
+                    data={"benchmark": "Public_AR_Current"}
+                )
+
+                if response.status_code == 200:
+                    for row in csv.reader(io.StringIO(response.text)):
+                        # id, input, Match/No_Match/Tie, Exact/Non_Exact, matched address, "lon,lat", ...
+                        if len(row) < 6 or row[2] != "Match":
+                            continue
+
+                        lon, lat = row[5].split(",")
+                        matches[int(row[0])] = {
+                            "lat": float(lat),
+                            "lon": float(lon),
+                            "formatted_address": row[4],
+                            "confidence": 0.95 if row[3] == "Exact" else 0.85,
+                            "source": "US Census Bureau"
+                        }
+                else:
+                    logger.warning(f"Census batch geocoder returned status {response.status_code}")
+
+        except Exception as e:
+            logger.error(f"Census batch geocoding error: {e}")
+
+        return matches
+
+    def _split_address(self, address: str) -> List[str]:
+        """Split a one-line address into Street, City, State, ZIP columns."""
+        parts = [part.strip() for part in address.split(",")]
+        street = parts[0]
+        city = parts[1] if len(parts) > 2 else ""
+        state, zip_code = "NY", ""
+
+        state_match = _STATE_ZIP_RE.match(parts[-1]) if len(parts) > 1 else None
+        if state_match:
+            state = state_match.group(1).upper()
+            zip_code = state_match.group(2) or ""
+        elif len(parts) > 1:
+            city = parts[1]
+
+        return [street, city, state, zip_code]
+
     async def _geocode_nominatim(self, address: str) -> Optional[Dict[str, Any]]:
         """Use Nominatim (OpenStreetMap) geocoder."""
         try:
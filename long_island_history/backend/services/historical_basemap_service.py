@@ -9,540 +9,445 @@ Provides historical map overlays from 100 BC to present:
 - Railroad development
 """
 
+import functools
+import gzip
+import hashlib
 import logging
+import math
+import sys
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Optional, List, Dict, Any
-import json
+
+import mapbox_vector_tile
+import numpy as np
+import shapely
+from cachetools import LRUCache
+from shapely.geometry import box, shape
+from shapely.strtree import STRtree
+
+from utils.json_utils import json_dumps, json_loads
 
 logger = logging.getLogger(__name__)
 
+# Half the width of the Web Mercator (EPSG:3857) world, in meters
+MERCATOR_HALF_WORLD = 20037508.342789244
+
+# Vector tile grid resolution (MVT default)
+MVT_EXTENT = 4096
+
+# Decimal places kept for stored coordinates (~0.1 m at Long Island latitudes)
+COORDINATE_PRECISION = 6
+
+# Highest zoom with a precomputed simplified copy of each layer
+SIMPLIFY_MAX_ZOOM = 14
+
+# Hilbert curve order used to sort features spatially (2**16 cells per axis)
+HILBERT_ORDER = 16
+
+# Static layer data, keyed by the layer ID used in the maps API; each file is
+# a GeoJSON FeatureCollection under data/historical_layers/
+LAYER_DATA_DIR = Path(__file__).parent / "data" / "historical_layers"
+LAYER_FILES = {
+    "native-territories": "native_territories.json",
+    "dutch-settlements": "dutch_settlements.json",
+    "colonial-towns": "colonial_towns.json",
+    "battle-long-island": "battle_of_long_island.json",
+    "lirr-1890": "lirr_1890.json",
+    "military-ww2": "ww2_military_sites.json",
+    "levittown": "levittown.json"
+}
+
+
+
+def _geometry_groups(geometry: Dict[str, Any]) -> List[List[List[List[float]]]]:
+    """
+    Normalize GeoJSON coordinates to groups -> parts -> positions.
+
+    A group is one polygon (or the whole geometry for other types); a part
+    is one ring, line, or run of points.
+    """
+    geometry_type = geometry["type"]
+    coordinates = geometry["coordinates"]
+
+    if geometry_type == "Point":
+        return [[[coordinates]]]
+    if geometry_type in ("LineString", "MultiPoint"):
+        return [[coordinates]]
+    if geometry_type in ("Polygon", "MultiLineString"):
+        return [coordinates]
+    if geometry_type == "MultiPolygon":
+        return coordinates
+    return []
+
+
+def _geometry_parts(geometry: Dict[str, Any]) -> List[np.ndarray]:
+    """Split a GeoJSON geometry into (N, 2) arrays, one per ring or line."""
+    return [
+        np.asarray(part, dtype=np.float64)
+        for group in _geometry_groups(geometry)
+        for part in group
+    ]
+
+
+@dataclass(slots=True)
+class LayerPayload:
+    """A layer at one level of detail, with its response bodies prebuilt."""
+    geojson: Dict[str, Any]
+    body: bytes
+    body_gzip: bytes
+    etag: str
+    etag_gzip: str
+
+    @classmethod
+    def from_geojson(cls, geojson: Dict[str, Any]) -> "LayerPayload":
+        """Serialize and gzip a layer once."""
+        return cls._from_body(geojson, json_dumps(geojson))
+
+    @classmethod
+    def from_arrays(cls, geojson: Dict[str, Any]) -> "LayerPayload":
+        """
+        Serialize a layer whose coordinates are NumPy arrays.
+
+        The arrays are encoded directly; the stored dict is decoded back
+        from the body so callers always get plain JSON types.
+        """
+        body = json_dumps(geojson)
+        return cls._from_body(_intern_strings(json_loads(body)), body)
+
+    @classmethod
+    def _from_body(cls, geojson: Dict[str, Any], body: bytes) -> "LayerPayload":
+        # blake2b is only a content fingerprint here, not a security boundary.
+        # The gzip body is a different representation, so it gets its own
+        # strong validator
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        return cls(
+            geojson=geojson,
+            body=body,
+            body_gzip=gzip.compress(body, compresslevel=9),
+            etag=f'"{digest}"',
+            etag_gzip=f'"{digest}-gz"'
+        )
+
+
+def _round_coordinates(coordinates, ndigits: int = COORDINATE_PRECISION):
+    """Round a (possibly nested) GeoJSON coordinates array."""
+    if isinstance(coordinates, (int, float)):
+        return round(coordinates, ndigits)
+    return [_round_coordinates(value, ndigits) for value in coordinates]
+
+
+def _intern_strings(obj):
+    """
+    Intern every string key and value in a decoded JSON structure.
+
+    Property values repeat across features and across the per-zoom copies
+    of each layer, so interning keeps one copy of each string.
+    """
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {sys.intern(key): _intern_strings(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_strings(value) for value in obj]
+    return obj
+
+
+def _hilbert_index(x: np.ndarray, y: np.ndarray, order: int = HILBERT_ORDER) -> np.ndarray:
+    """Distance along a Hilbert curve for integer cells on a 2**order grid."""
+    n = 1 << order
+    x = x.astype(np.int64)
+    y = y.astype(np.int64)
+    d = np.zeros_like(x)
+
+    s = n >> 1
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+
+        # Rotate the quadrant so the sub-curve has the canonical orientation
+        flip = ~ry & rx
+        x = np.where(flip, n - 1 - x, x)
+        y = np.where(flip, n - 1 - y, y)
+        x, y = np.where(ry, x, y), np.where(ry, y, x)
+        s >>= 1
+
+    return d
+
+
+def _prepare_layer(collection: Dict[str, Any]) -> None:
+    """
+    Normalize a layer in place.
+
+    Rounds coordinates to COORDINATE_PRECISION and sets the GeoJSON bbox
+    member on every feature and on the feature collection. Feature order
+    is left as in the data file.
+    """
+    for feature in collection["features"]:
+        geometry = feature["geometry"]
+        geometry["coordinates"] = _round_coordinates(geometry["coordinates"])
+
+        coords = np.concatenate(_geometry_parts(geometry))
+        feature["bbox"] = [*coords.min(axis=0).tolist(), *coords.max(axis=0).tolist()]
+
+    bboxes = np.array([feature["bbox"] for feature in collection["features"]])
+    collection["bbox"] = [*bboxes[:, :2].min(axis=0).tolist(), *bboxes[:, 2:].max(axis=0).tolist()]
+
+
+def _hilbert_order(features: List[Dict[str, Any]]) -> np.ndarray:
+    """Positions of features (with bbox members) sorted along a Hilbert curve by bbox center."""
+    bboxes = np.array([feature["bbox"] for feature in features])
+    cells = (1 << HILBERT_ORDER) - 1
+    lon = (bboxes[:, 0] + bboxes[:, 2]) / 2
+    lat = (bboxes[:, 1] + bboxes[:, 3]) / 2
+    keys = _hilbert_index((lon + 180.0) / 360.0 * cells, (lat + 90.0) / 180.0 * cells)
+    return np.argsort(keys, kind="stable")
+
+
+@functools.cache
+def _load_layer(layer_id: str) -> Dict[str, Any]:
+    """Read and normalize a layer's data file; each file is parsed only once."""
+    collection = _intern_strings(json_loads((LAYER_DATA_DIR / LAYER_FILES[layer_id]).read_bytes()))
+    _prepare_layer(collection)
+    return collection
+
+
+def _lonlat_to_mercator(coords: np.ndarray) -> np.ndarray:
+    """Project an (N, 2) array of WGS84 lon/lat to Web Mercator meters."""
+    x = coords[:, 0] * (MERCATOR_HALF_WORLD / 180.0)
+    y = np.log(np.tan((90.0 + coords[:, 1]) * (np.pi / 360.0))) * (MERCATOR_HALF_WORLD / np.pi)
+    return np.column_stack((x, y))
+
+
+def _geometry_coordinates(geometry):
+    """GeoJSON coordinates of a shapely geometry, with each ring or line as an (N, 2) array."""
+    geometry_type = geometry.geom_type
+
+    if geometry_type == "Polygon":
+        return [shapely.get_coordinates(ring) for ring in (geometry.exterior, *geometry.interiors)]
+    if geometry_type in ("MultiLineString", "MultiPolygon"):
+        return [_geometry_coordinates(part) for part in geometry.geoms]
+
+    coords = shapely.get_coordinates(geometry)
+    return coords[0] if geometry_type == "Point" else coords
+
+
+def _simplify_tolerance(z: int) -> float:
+    """Douglas-Peucker tolerance in degrees: half a pixel of a 256px tile at zoom z."""
+    return 360.0 / (256 * (1 << z)) * 0.5
+
+
+def _tile_bounds(z: int, x: int, y: int) -> tuple:
+    """Web Mercator bounds (minx, miny, maxx, maxy) of an XYZ tile."""
+    size = 2 * MERCATOR_HALF_WORLD / (1 << z)
+    minx = -MERCATOR_HALF_WORLD + x * size
+    maxy = MERCATOR_HALF_WORLD - y * size
+    return minx, maxy - size, minx + size, maxy
+
+
+def _tile_lonlat_bounds(z: int, x: int, y: int) -> tuple:
+    """WGS84 bounds (west, south, east, north) of an XYZ tile."""
+    n = 1 << z
+
+    def lat(row: int) -> float:
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * row / n))))
+
+    return x / n * 360.0 - 180.0, lat(y + 1), (x + 1) / n * 360.0 - 180.0, lat(y)
+
 
 class HistoricalBasemapService:
     """Service for historical basemap overlays."""
 
     def __init__(self):
-        self.geojson_data = self._initialize_geojson_data()
-
-    def _initialize_geojson_data(self) -> Dict[str, Any]:
-        """Initialize GeoJSON data for historical layers."""
-        return {
-            "native-territories": self._create_native_territories(),
-            "dutch-settlements": self._create_dutch_settlements(),
-            "colonial-towns": self._create_colonial_towns(),
-            "battle-long-island": self._create_battle_map(),
-            "lirr-1890": self._create_lirr_1890(),
-            "military-ww2": self._create_ww2_sites(),
-            "levittown": self._create_levittown()
-        }
+        # Layer data is static and shared by every instance
+        self.geojson_data = {layer_id: _load_layer(layer_id) for layer_id in LAYER_FILES}
 
-    def _create_native_territories(self) -> Dict[str, Any]:
-        """Create GeoJSON for Native American territories."""
-        return {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Canarsie",
-                        "description": "Western Long Island (Brooklyn area)",
-                        "period": "Pre-contact to 1650s"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-74.0, 40.65], [-73.9, 40.7], [-73.85, 40.65],
-                            [-73.9, 40.58], [-74.0, 40.65]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Rockaway",
-                        "description": "Rockaway Peninsula area",
-                        "period": "Pre-contact to 1650s"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-73.95, 40.58], [-73.75, 40.6], [-73.75, 40.55],
-                            [-73.95, 40.53], [-73.95, 40.58]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Matinecock",
-                        "description": "North Shore, Oyster Bay to Huntington area",
-                        "period": "Pre-contact to 1700s"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-73.6, 40.85], [-73.4, 40.9], [-73.3, 40.88],
-                            [-73.3, 40.8], [-73.6, 40.78], [-73.6, 40.85]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Massapequa",
-                        "description": "South Shore, Massapequa to Amityville",
-                        "period": "Pre-contact to 1650s"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-73.5, 40.7], [-73.35, 40.7], [-73.35, 40.62],
-                            [-73.5, 40.62], [-73.5, 40.7]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Setauket",
-                        "description": "Central North Shore, Setauket area",
-                        "period": "Pre-contact to 1700s"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-73.15, 40.92], [-72.95, 40.95], [-72.9, 40.88],
-                            [-73.1, 40.85], [-73.15, 40.92]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Unkechaug",
-                        "description": "Mastic area, Poospatuck Reservation today",
-                        "period": "Pre-contact to present",
-                        "status": "State-recognized tribe with reservation"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-72.88, 40.8], [-72.78, 40.82], [-72.75, 40.76],
-                            [-72.85, 40.74], [-72.88, 40.8]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Shinnecock",
-                        "description": "Southampton area",
-                        "period": "Pre-contact to present",
-                        "status": "Federally recognized tribe (2010) with reservation"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-72.5, 40.9], [-72.3, 40.92], [-72.25, 40.85],
-                            [-72.45, 40.82], [-72.5, 40.9]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Montaukett",
-                        "description": "Eastern tip of Long Island",
-                        "period": "Pre-contact to present",
-                        "status": "Seeking state and federal recognition"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-72.0, 41.05], [-71.85, 41.08], [-71.85, 40.95],
-                            [-72.0, 40.93], [-72.0, 41.05]
-                        ]]
-                    }
-                }
-            ]
+        # Layers are static, so serialize each one once up front
+        self._layers = {
+            layer_id: LayerPayload.from_geojson(geojson)
+            for layer_id, geojson in self.geojson_data.items()
         }
 
-    def _create_dutch_settlements(self) -> Dict[str, Any]:
-        """Create GeoJSON for Dutch colonial settlements."""
-        return {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Breuckelen (Brooklyn)",
-                        "established": 1646,
-                        "description": "Named after Breukelen in the Netherlands"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.9442, 40.6782]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Nieuw Amersfoort (Flatlands)",
-                        "established": 1636,
-                        "description": "Early Dutch farming settlement"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.9245, 40.6165]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Midwout (Flatbush)",
-                        "established": 1652,
-                        "description": "Dutch agricultural village"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.9580, 40.6520]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Boswijck (Bushwick)",
-                        "established": 1661,
-                        "description": "Dutch settlement"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.9212, 40.6944]
-                    }
-                }
-            ]
-        }
+        # R-tree over every feature so viewport queries don't scan all geometries.
+        # It is built in Hilbert order so map neighbours share tree nodes;
+        # _tree_order maps tree positions back to _indexed_features, which
+        # keeps the layers' own feature order
+        self._indexed_features = [
+            (layer_id, feature)
+            for layer_id, geojson in self.geojson_data.items()
+            for feature in geojson["features"]
+        ]
+        geometries = [shape(feature["geometry"]) for _, feature in self._indexed_features]
+        self._tree_order = _hilbert_order([feature for _, feature in self._indexed_features])
+        self._strtree = STRtree([geometries[index] for index in self._tree_order])
 
-    def _create_colonial_towns(self) -> Dict[str, Any]:
-        """Create GeoJSON for colonial-era township boundaries."""
-        return {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Southampton",
-                        "established": 1640,
-                        "description": "First English settlement in New York"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-72.6, 40.95], [-72.2, 41.0], [-72.0, 40.9],
-                            [-72.0, 40.75], [-72.6, 40.7], [-72.6, 40.95]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Southold",
-                        "established": 1640,
-                        "description": "Founded by New Haven colonists"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-72.6, 41.1], [-72.0, 41.15], [-71.9, 41.05],
-                            [-72.4, 40.95], [-72.6, 41.1]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "East Hampton",
-                        "established": 1648,
-                        "description": "English Puritan settlement"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-72.2, 41.05], [-71.85, 41.1], [-71.85, 40.92],
-                            [-72.2, 40.88], [-72.2, 41.05]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Huntington",
-                        "established": 1653,
-                        "description": "English settlement"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-73.5, 40.92], [-73.25, 40.95], [-73.2, 40.75],
-                            [-73.45, 40.72], [-73.5, 40.92]
-                        ]]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Brookhaven",
-                        "established": 1655,
-                        "description": "Largest town by area in New York"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-73.2, 40.95], [-72.6, 41.0], [-72.6, 40.7],
-                            [-73.1, 40.7], [-73.2, 40.95]
-                        ]]
-                    }
-                }
-            ]
-        }
+        # Simplified copies per zoom, keyed by (layer_id, z), so low-zoom
+        # clients aren't sent vertices closer together than a pixel
+        simplified_data = {}
+        for z in range(SIMPLIFY_MAX_ZOOM + 1):
+            simplified = shapely.simplify(
+                np.asarray(geometries, dtype=object), _simplify_tolerance(z), preserve_topology=True
+            )
+            for layer_id, geojson in self.geojson_data.items():
+                simplified_data[(layer_id, z)] = {**geojson, "features": []}
+            for (layer_id, feature), geometry in zip(self._indexed_features, simplified):
+                simplified_data[(layer_id, z)]["features"].append({
+                    **feature,
+                    "geometry": {
+                        "type": geometry.geom_type,
+                        "coordinates": _geometry_coordinates(geometry)
+                    }
+                })
 
-    def _create_battle_map(self) -> Dict[str, Any]:
-        """Create GeoJSON for Battle of Long Island (1776)."""
-        return {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "British Landing at Gravesend",
-                        "date": "August 22, 1776",
-                        "description": "15,000 British troops land"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.98, 40.59]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Jamaica Pass",
-                        "date": "August 27, 1776",
-                        "description": "British flanking maneuver through unguarded pass"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.87, 40.7]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Battle of Gowanus",
-                        "date": "August 27, 1776",
-                        "description": "Maryland troops hold off British"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.99, 40.67]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Washington's Retreat",
-                        "date": "August 29-30, 1776",
-                        "description": "Continental Army evacuates across East River"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.99, 40.7]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "American Lines",
-                        "description": "Defensive positions along Brooklyn Heights"
-                    },
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": [
-                            [-74.0, 40.65], [-73.97, 40.68], [-73.94, 40.69]
-                        ]
-                    }
-                }
-            ]
+        self._simplified_layers = {
+            key: LayerPayload.from_arrays(geojson)
+            for key, geojson in simplified_data.items()
         }
 
-    def _create_lirr_1890(self) -> Dict[str, Any]:
-        """Create GeoJSON for Long Island Rail Road network circa 1890."""
-        return {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Main Line",
-                        "description": "Jamaica to Greenport",
-                        "opened": 1844
-                    },
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": [
-                            [-73.8, 40.7], [-73.5, 40.75], [-73.2, 40.85],
-                            [-72.9, 40.88], [-72.6, 40.92], [-72.35, 41.1]
-                        ]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Montauk Branch",
-                        "description": "Jamaica to Montauk",
-                        "opened": 1895
-                    },
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": [
-                            [-73.8, 40.7], [-73.5, 40.68], [-73.2, 40.73],
-                            [-72.8, 40.78], [-72.3, 40.87], [-71.95, 41.05]
-                        ]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Oyster Bay Branch",
-                        "opened": 1889
-                    },
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": [
-                            [-73.7, 40.75], [-73.6, 40.8], [-73.52, 40.87]
-                        ]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Port Jefferson Branch",
-                        "opened": 1873
-                    },
-                    "geometry": {
-                        "type": "LineString",
-                        "coordinates": [
-                            [-73.5, 40.77], [-73.35, 40.82], [-73.15, 40.92],
-                            [-73.07, 40.93]
-                        ]
-                    }
-                }
-            ]
-        }
+        # Web Mercator copies, projected once, for tile rendering; kept as a
+        # geometry array so tile clipping is one vectorized GEOS call
+        self._mercator_geometries = shapely.transform(
+            np.asarray(geometries, dtype=object), _lonlat_to_mercator
+        )
 
-    def _create_ww2_sites(self) -> Dict[str, Any]:
-        """Create GeoJSON for WWII military sites."""
-        return {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Camp Upton",
-                        "type": "Army Training Camp",
-                        "description": "Induction and training center",
-                        "now": "Brookhaven National Laboratory"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-72.87, 40.87]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Mitchel Field",
-                        "type": "Army Air Forces Base",
-                        "description": "Major air base"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.6, 40.73]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Grumman Aircraft",
-                        "type": "Aircraft Manufacturing",
-                        "description": "F6F Hellcat, TBF Avenger production"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.49, 40.76]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Republic Aviation",
-                        "type": "Aircraft Manufacturing",
-                        "description": "P-47 Thunderbolt production"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.44, 40.73]
-                    }
-                },
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Roosevelt Field",
-                        "type": "Aviation History",
-                        "description": "Lindbergh's 1927 departure point"
-                    },
-                    "geometry": {
-                        "type": "Point",
-                        "coordinates": [-73.62, 40.74]
-                    }
-                }
-            ]
-        }
+        # Encoded vector tiles, keyed by (layer_id, z, x, y)
+        self._tile_cache = LRUCache(maxsize=1024)
 
-    def _create_levittown(self) -> Dict[str, Any]:
-        """Create GeoJSON for original Levittown development."""
-        return {
-            "type": "FeatureCollection",
-            "features": [
-                {
-                    "type": "Feature",
-                    "properties": {
-                        "name": "Levittown Original Bounds",
-                        "established": 1947,
-                        "homes": 17447,
-                        "description": "America's first mass-produced suburb"
-                    },
-                    "geometry": {
-                        "type": "Polygon",
-                        "coordinates": [[
-                            [-73.55, 40.74], [-73.48, 40.74],
-                            [-73.48, 40.70], [-73.55, 40.70],
-                            [-73.55, 40.74]
-                        ]]
-                    }
-                }
-            ]
-        }
+        # Layer listing never changes either
+        self._available_layers = tuple(
+            {
+                "layer_id": layer_id,
+                "name": layer_id.replace("-", " ").title(),
+                "feature_count": len(geojson.get("features", []))
+            }
+            for layer_id, geojson in self.geojson_data.items()
+        )
+
+    async def get_geojson_layer(self, layer_id: str, z: Optional[int] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get GeoJSON data for a specific layer.
+
+        If a zoom level is given, geometry is simplified for that zoom;
+        above SIMPLIFY_MAX_ZOOM the full-precision layer is returned.
+        """
+        payload = self._get_payload(layer_id, z)
+        return payload.geojson if payload else None
+
+    def get_geojson_layer_bytes(self, layer_id: str, z: Optional[int] = None) -> Optional[bytes]:
+        """Get the pre-serialized GeoJSON for a layer, ready to send as a response body."""
+        payload = self._get_payload(layer_id, z)
+        return payload.body if payload else None
+
+    def get_geojson_layer_gzip(self, layer_id: str, z: Optional[int] = None) -> Optional[bytes]:
+        """Get the pre-serialized GeoJSON for a layer, gzip-compressed."""
+        payload = self._get_payload(layer_id, z)
+        return payload.body_gzip if payload else None
 
-    async def get_geojson_layer(self, layer_id: str) -> Optional[Dict[str, Any]]:
-        """Get GeoJSON data for a specific layer."""
-        return self.geojson_data.get(layer_id)
+    def get_geojson_layer_etag(
+        self,
+        layer_id: str,
+        z: Optional[int] = None,
+        compressed: bool = False
+    ) -> Optional[str]:
+        """Get the ETag for a layer's GeoJSON body, or for its gzip body if compressed."""
+        payload = self._get_payload(layer_id, z)
+        if not payload:
+            return None
+        return payload.etag_gzip if compressed else payload.etag
+
+    def _get_payload(self, layer_id: str, z: Optional[int]) -> Optional[LayerPayload]:
+        """Look up a layer at the level of detail for a zoom (None for full precision)."""
+        if z is None or z > SIMPLIFY_MAX_ZOOM:
+            return self._layers.get(layer_id)
+        return self._simplified_layers.get((layer_id, z))
+
+    def query_bbox(
+        self,
+        minx: float,
+        miny: float,
+        maxx: float,
+        maxy: float,
+        layer_id: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get features intersecting a lon/lat bounding box.
+
+        Optionally restricted to a single layer. Features are returned in
+        their original layer order.
+        """
+        return [
+            self._indexed_features[index][1]
+            for index in self._query_indices(minx, miny, maxx, maxy, layer_id)
+        ]
+
+    def _query_indices(
+        self,
+        minx: float,
+        miny: float,
+        maxx: float,
+        maxy: float,
+        layer_id: Optional[str]
+    ) -> List[int]:
+        """Indices into _indexed_features of features intersecting a lon/lat box."""
+        indices = self._tree_order[
+            self._strtree.query(box(minx, miny, maxx, maxy), predicate="intersects")
+        ]
+
+        return [
+            index for index in sorted(indices)
+            if layer_id is None or self._indexed_features[index][0] == layer_id
+        ]
+
+    def get_mvt_tile(self, layer_id: str, z: int, x: int, y: int) -> Optional[bytes]:
+        """
+        Get a gzipped Mapbox Vector Tile for one layer.
+
+        Only features intersecting the tile are included, clipped to the
+        tile (plus a small buffer). Returns None for unknown layers.
+        """
+        if layer_id not in self.geojson_data:
+            return None
+
+        cache_key = (layer_id, z, x, y)
+        tile = self._tile_cache.get(cache_key)
+        if tile is not None:
+            return tile
+
+        bounds = _tile_bounds(z, x, y)
+        buffer = (bounds[2] - bounds[0]) / 64
+
+        indices = self._query_indices(*_tile_lonlat_bounds(z, x, y), layer_id)
+        clipped = shapely.clip_by_rect(
+            self._mercator_geometries[indices],
+            bounds[0] - buffer, bounds[1] - buffer,
+            bounds[2] + buffer, bounds[3] + buffer
+        )
+
+        tile_features = [
+            {
+                "geometry": geometry,
+                "properties": self._indexed_features[index][1].get("properties", {})
+            }
+            for index, geometry in zip(indices, clipped)
+            if not geometry.is_empty
+        ]
+
+        encoded = mapbox_vector_tile.encode(
+            [{"name": layer_id, "features": tile_features}],
+            default_options={"quantize_bounds": bounds, "extents": MVT_EXTENT}
+        )
+
+        tile = gzip.compress(encoded)
+        self._tile_cache[cache_key] = tile
+        return tile
 
     async def get_available_layers(self) -> List[Dict[str, Any]]:
         """Get list of available historical map layers."""
-        layers = []
-        for layer_id, geojson in self.geojson_data.items():
-            layers.append({
-                "layer_id": layer_id,
-                "name": layer_id.replace("-", " ").title(),
-                "feature_count": len(geojson.get("features", []))
-            })
-        return layers
+        return list(self._available_layers)
+
+
+@functools.cache
+def get_historical_basemap_service() -> HistoricalBasemapService:
+    """Get the shared HistoricalBasemapService, building its indexes on first use."""
+    return HistoricalBasemapService()
@@ -7,13 +7,71 @@ Provides access to:
 - Leaf-off imagery for better ground visibility
 """
 
+import asyncio
+import functools
 import logging
-from typing import Optional, List, Dict, Any
+import time
+from typing import Optional, List, Dict, Any, Tuple
+from urllib.parse import urlencode
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+
+from utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+# MapServer extents only change when a service is republished
+EXTENT_CACHE_TTL = 24 * 3600
+
+# Seconds a single availability probe may take before it is cancelled and
+# the layer assumed available, so one slow MapServer can't stall the list
+PROBE_TIMEOUT = 2.0
+
+# (west, south, east, north) around Long Island; every NYS statewide
+# orthoimagery service covers it, so no extent lookup is needed inside it
+_LI_BBOX = (-74.05, 40.5, -71.85, 41.2)
+
+# Degrees per meter at Long Island's latitude (1 degree ≈ 111km lat, 85km lon)
+_INV_LAT_DEG_M = 1.0 / 111000.0
+_INV_LON_DEG_M = 1.0 / 85000.0
+
+
+def _make_bbox_str(
+    lat: float,
+    lon: float,
+    extent_meters: float,
+    lat_first: bool = False
+) -> str:
+    """
+    Format the bounding box extent_meters around a point.
+
+    Returns "minx,miny,maxx,maxy", or "miny,minx,maxy,maxx" when lat_first
+    is set (the WMS 1.3.0 axis order for EPSG:4326).
+    """
+    lat_extent = extent_meters * _INV_LAT_DEG_M
+    lon_extent = extent_meters * _INV_LON_DEG_M
+
+    if lat_first:
+        return f"{lat - lat_extent},{lon - lon_extent},{lat + lat_extent},{lon + lon_extent}"
+    return f"{lon - lon_extent},{lat - lat_extent},{lon + lon_extent},{lat + lat_extent}"
+
+
+@functools.lru_cache(maxsize=64)
+def _export_url_prefix(base_url: str, width: int, height: int) -> str:
+    """
+    Everything in an export URL except the bbox value.
+
+    Only the bbox changes between tiles of one layer at one size, so the
+    rest is encoded once per (layer, size).
+    """
+    query = urlencode({
+        "bboxSR": "4326",
+        "size": f"{width},{height}",
+        "imageSR": "4326",
+        "format": "jpg",
+        "f": "image"
+    }, safe=",")
+    return f"{base_url}/export?{query}&bbox="
+
 
 class ImageryService:
     """Service for retrieving aerial imagery from NYS GIS."""
@@ -78,26 +136,11 @@ class ImageryService:
 
         self.timeout = httpx.Timeout(30.0)
 
-    async def get_available_imagery(
-        self,
-        lat: float,
-        lon: float
-    ) -> List[Dict[str, Any]]:
-        """
-        Get list of available imagery for a location.
-
-        Returns list of imagery layers sorted by year (newest first).
-        """
-        available = []
-
-        for year, info in self.available_years.items():
-            # Check if imagery is available at this location
-            is_available = await self._check_imagery_availability(
-                lat, lon, info["url"]
-            )
-
-            if is_available:
-                available.append({
+        # (service_url, layer entry) pairs, newest year first; the entries
+        # are static so get_available_imagery only has to filter them
+        self._imagery_templates: List[Tuple[str, Dict[str, Any]]] = sorted(
+            (
+                (info["url"], {
                     "layer_id": f"nys_ortho_{year.lower()}",
                     "name": f"NYS Orthoimagery {year}",
                     "description": info["description"],
@@ -108,11 +151,63 @@ class ImageryService:
                     "wms_url": f"{info['url']}/WMSServer",
                     "tile_url": f"{info['url']}/tile/{{z}}/{{y}}/{{x}}"
                 })
+                for year, info in self.available_years.items()
+            ),
+            key=lambda template: template[1]["year"],
+            reverse=True
+        )
 
-        # Sort by year descending
-        available.sort(key=lambda x: x.get("year", 0), reverse=True)
+        # service_url -> (expiry on the monotonic clock, fullExtent)
+        self._extent_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+        # One pooled client for the service lifetime so repeated MapServer
+        # probes reuse keep-alive connections instead of new TLS handshakes
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                # httpx drops idle connections after 5s by default, which
+                # loses the pool between user requests; keep them for a minute
+                keepalive_expiry=60.0
+            ),
+            headers={"User-Agent": "LongIslandHistoricalLandSystem/1.0"}
+        )
 
-        return available
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def get_available_imagery(
+        self,
+        lat: float,
+        lon: float
+    ) -> List[Dict[str, Any]]:
+        """
+        Get list of available imagery for a location.
+
+        Returns list of imagery layers sorted by year (newest first).
+        """
+        # Probe every year's service concurrently over the shared pool
+        checks = await asyncio.gather(
+            *(
+                asyncio.wait_for(
+                    self._check_imagery_availability(lat, lon, service_url),
+                    timeout=PROBE_TIMEOUT
+                )
+                for service_url, _ in self._imagery_templates
+            ),
+            return_exceptions=True
+        )
+
+        # Templates are already newest-first; copy so callers can't mutate them.
+        # A failed or timed-out probe falls back to available, like the check itself.
+        return [
+            dict(template)
+            for (_, template), is_available in zip(self._imagery_templates, checks)
+            if is_available is True or isinstance(is_available, Exception)
+        ]
 
     async def _check_imagery_availability(
         self,
@@ -121,34 +216,58 @@ class ImageryService:
         service_url: str
     ) -> bool:
         """Check if imagery is available at a location."""
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Query the service info
-                response = await client.get(f"{service_url}?f=json")
+        if (
+            _LI_BBOX[0] <= lon <= _LI_BBOX[2]
+            and _LI_BBOX[1] <= lat <= _LI_BBOX[3]
+            and service_url.startswith(self.nys_base_url)
+        ):
+            return True
+
+        extent = await self._get_service_extent(service_url)
+
+        if extent is None:
+            # Default to assuming available for Long Island
+            return True
+
+        # Check if location is within service extent
+        xmin = extent.get("xmin", -180)
+        xmax = extent.get("xmax", 180)
+        ymin = extent.get("ymin", -90)
+        ymax = extent.get("ymax", 90)
 
-                if response.status_code == 200:
-                    data = response.json()
-                    extent = data.get("fullExtent", {})
+        # Note: Extent may be in Web Mercator, need to handle both
+        if abs(xmin) > 180:  # Web Mercator
+            return True  # Assume available for Long Island
 
-                    # Check if location is within service extent
-                    xmin = extent.get("xmin", -180)
-                    xmax = extent.get("xmax", 180)
-                    ymin = extent.get("ymin", -90)
-                    ymax = extent.get("ymax", 90)
+        return xmin <= lon <= xmax and ymin <= lat <= ymax
 
-                    # Note: Extent may be in Web Mercator, need to handle both
-                    if abs(xmin) > 180:  # Web Mercator
-                        return True  # Assume available for Long Island
+    async def _get_service_extent(self, service_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a MapServer's fullExtent, cached for EXTENT_CACHE_TTL seconds.
+
+        Returns None when the service info can't be fetched; failures are
+        not cached so the next call retries.
+        """
+        cached = self._extent_cache.get(service_url)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
 
-                    return xmin <= lon <= xmax and ymin <= lat <= ymax
+        try:
+            # Query the service info
+            response = await self._client.get(f"{service_url}?f=json")
+
+            if response.status_code == 200:
+                extent = json_loads(response.content).get("fullExtent", {})
+                self._extent_cache[service_url] = (
+                    time.monotonic() + EXTENT_CACHE_TTL, extent
+                )
+                return extent
 
         except Exception as e:
             logger.debug(f"Error checking imagery availability: {e}")
 
-        # Default to assuming available for Long Island
-        return True
+        return None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def get_current_aerial(
         self,
         lat: float,
@@ -162,18 +281,6 @@ class ImageryService:
 
         Returns WMS parameters for fetching the image.
         """
-        # Calculate bounding box (approximate degrees from meters)
-        # At Long Island's latitude, 1 degree ≈ 85km lat, 111km lon
-        lat_extent = extent_meters / 111000
-        lon_extent = extent_meters / 85000
-
-        bbox = {
-            "minx": lon - lon_extent,
-            "miny": lat - lat_extent,
-            "maxx": lon + lon_extent,
-            "maxy": lat + lat_extent
-        }
-
         wms_params = {
             "service": "WMS",
             "version": "1.3.0",
@@ -181,7 +288,7 @@ class ImageryService:
             "layers": "0",
             "styles": "",
             "crs": "EPSG:4326",
-            "bbox": f"{bbox['miny']},{bbox['minx']},{bbox['maxy']},{bbox['maxx']}",
+            "bbox": _make_bbox_str(lat, lon, extent_meters, lat_first=True),
             "width": str(width),
             "height": str(height),
             "format": "image/jpeg"
@@ -221,16 +328,6 @@ class ImageryService:
         if year_str not in self.available_years:
             return None
 
-        lat_extent = extent_meters / 111000
-        lon_extent = extent_meters / 85000
-
-        bbox = {
-            "minx": lon - lon_extent,
-            "miny": lat - lat_extent,
-            "maxx": lon + lon_extent,
-            "maxy": lat + lat_extent
-        }
-
         wms_params = {
             "service": "WMS",
             "version": "1.3.0",
@@ -238,7 +335,7 @@ class ImageryService:
             "layers": "0",
             "styles": "",
             "crs": "EPSG:4326",
-            "bbox": f"{bbox['miny']},{bbox['minx']},{bbox['maxy']},{bbox['maxx']}",
+            "bbox": _make_bbox_str(lat, lon, extent_meters, lat_first=True),
             "width": str(width),
             "height": str(height),
             "format": "image/jpeg"
@@ -261,22 +358,8 @@ class ImageryService:
         year_key: str
     ) -> str:
         """Build ArcGIS REST export URL for direct image fetching."""
-        lat_extent = extent_meters / 111000
-        lon_extent = extent_meters / 85000
-
-        bbox = f"{lon - lon_extent},{lat - lat_extent},{lon + lon_extent},{lat + lat_extent}"
-
         base_url = self.available_years[year_key]["url"]
-
-        return (
-            f"{base_url}/export?"
-            f"bbox={bbox}&"
-            f"bboxSR=4326&"
-            f"size={width},{height}&"
-            f"imageSR=4326&"
-            f"format=jpg&"
-            f"f=image"
-        )
+        return _export_url_prefix(base_url, width, height) + _make_bbox_str(lat, lon, extent_meters)
 
     def get_tile_layer_config(self, year: str = "Latest") -> Dict[str, Any]:
         """
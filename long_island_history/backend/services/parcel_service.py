@@ -9,13 +9,206 @@ Connects to county GIS portals to retrieve:
 - Assessment data
 """
 
+import asyncio
+import copy
 import logging
-from typing import Optional, List, Dict, Any
+import math
+import re
+from contextlib import asynccontextmanager
+from typing import Optional, List, Dict, Any, AsyncIterator, Callable, Set, Tuple
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import shapely
+from cachetools import TTLCache
+from shapely.geometry import shape
+
+from utils.json_utils import json_loads
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+# Coordinates are rounded to this many decimals (~1 m) for the location cache
+LOCATION_CACHE_PRECISION = 5
+
+# Attempts and exponential backoff bounds (seconds) for GIS requests
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_BASE = 2.0
+RETRY_BACKOFF_CAP = 10.0
+
+# GeoJSON bodies at least this large (or of unknown length) are decoded
+# feature by feature as they stream in, when ijson is installed
+STREAM_PARSE_MIN_BYTES = 50 * 1024
+
+# Seconds a county point query (retries included) may take before it is
+# cancelled, so a slow county can't hold up the other county's answer
+COUNTY_QUERY_TIMEOUT = 15.0
+
+# Concurrent lookups in the same 0.01 degree tile (~1 km) are merged into one
+# envelope query; the first lookup waits this long (seconds) for company
+TILE_BATCH_WINDOW = 0.02
+
+# Attributes read by _format_address
+_ADDRESS_FIELDS = ("STREET_NUM", "HOUSE_NUMBER", "STREET_NAME", "STREET", "CITY", "TOWN", "ADDRESS")
+
+# (parcel key, attribute names in order of preference, default) per county;
+# the first truthy attribute wins, as with chained `attrs.get(a) or attrs.get(b)`
+_SUFFOLK_FIELD_MAP = (
+    ("sbl", ("SBL", "TAX_MAP_ID"), ""),
+    ("municipality", ("TOWN", "MUNICIPALITY"), ""),
+    ("owner_name", ("OWNER", "OWNER_NAME"), None),
+    ("acreage", ("ACREAGE", "ACRES"), None),
+    ("land_use_code", ("PROP_CLASS", "LAND_USE"), None),
+    ("land_use_description", ("PROP_CLASS_DESC",), None),
+    ("year_built", ("YEAR_BUILT",), None),
+    ("assessed_value", ("TOTAL_ASSESSED_VALUE",), None),
+    ("deed_book", ("DEED_BOOK",), None),
+    ("deed_page", ("DEED_PAGE",), None),
+    ("deed_date", ("DEED_DATE",), None)
+)
+_NASSAU_FIELD_MAP = (
+    ("sbl", ("SBL", "PRINT_KEY"), ""),
+    ("municipality", ("CITY", "VILLAGE"), ""),
+    ("owner_name", ("OWNER",), None),
+    ("acreage", ("ACRES",), None),
+    ("land_use_code", ("PROP_CLASS",), None),
+    ("land_use_description", ("PROP_CLASS_DESC",), None),
+    ("year_built", ("YR_BLT",), None),
+    ("assessed_value", ("ASSESSED_VALUE",), None),
+    ("deed_book", ("DEED_BOOK",), None),
+    ("deed_page", ("DEED_PAGE",), None),
+    ("deed_date", ("DEED_DATE",), None)
+)
+
+# Attributes read by each county's response parser, requested as outFields
+_SUFFOLK_FIELDS = tuple(dict.fromkeys(
+    [name for _, names, _ in _SUFFOLK_FIELD_MAP for name in names]
+    + ["LAT", "LON", *_ADDRESS_FIELDS]
+))
+_NASSAU_FIELDS = tuple(dict.fromkeys(
+    [name for _, names, _ in _NASSAU_FIELD_MAP for name in names] + list(_ADDRESS_FIELDS)
+))
+
+# Query parameters shared by every parcel layer query
+_BASE_QUERY_PARAMS = {"f": "geojson", "outSR": "4326"}
+_POINT_QUERY_PARAMS = _BASE_QUERY_PARAMS | {
+    "geometryType": "esriGeometryPoint",
+    "spatialRel": "esriSpatialRelIntersects"
+}
+_ENVELOPE_QUERY_PARAMS = _BASE_QUERY_PARAMS | {
+    "geometryType": "esriGeometryEnvelope",
+    "inSR": "4326",
+    "spatialRel": "esriSpatialRelIntersects",
+    "returnGeometry": "true"
+}
+
+# SBLs per ArcGIS `IN (...)` query, keeping the request URL a sane length
+SBL_BATCH_SIZE = 50
+
+# Suffolk SBLs look like 0200-001.00-01.00-001.000, Nassau keys like 01-001-0001
+_SBL_PATTERN = re.compile(r"^[0-9A-Z.\-]+$", re.IGNORECASE)
+
+
+def _sql_in_list(values: List[str]) -> str:
+    """Format values as the body of an ArcGIS where `IN (...)` clause."""
+    return ",".join(f"'{_escape_sql(value)}'" for value in values)
+
+
+def _is_suffolk_sbl(sbl: str) -> bool:
+    """Suffolk SBLs have four hyphenated parts; Nassau keys have fewer."""
+    return len(sbl.split("-")) == 4
+
+
+def _extract_attributes(
+    attrs: Dict[str, Any],
+    field_map: Tuple[Tuple[str, Tuple[str, ...], Any], ...]
+) -> Dict[str, Any]:
+    """Pull the standardized parcel fields out of GIS attributes in one pass."""
+    parcel = {}
+    for key, names, default in field_map:
+        for name in names:
+            value = attrs.get(name)
+            if value:
+                break
+        else:
+            # Nothing truthy; keep the last attribute's raw value (e.g. 0)
+            value = attrs.get(names[-1], default)
+        parcel[key] = value
+    return parcel
+
+
+def _escape_sql(value: str) -> str:
+    """Escape a value for use inside a single-quoted ArcGIS where literal."""
+    return value.replace("'", "''")
+
+
+class _AsyncByteReader:
+    """Adapts an async byte iterator to the read() interface ijson expects."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks
+
+    async def read(self, size: int = -1) -> bytes:
+        # ijson probes the stream type with read(0); don't consume a chunk
+        if size == 0:
+            return b""
+        try:
+            return await self._chunks.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+async def _read_geojson(response: httpx.Response) -> Dict[str, Any]:
+    """
+    Decode a streamed ArcGIS GeoJSON response.
+
+    Large bodies are parsed incrementally so the raw bytes are never held
+    alongside the decoded features. Only the features and the top-level
+    error/truncation flags are kept, which is all the callers read.
+    """
+    length = response.headers.get("content-length")
+    if ijson is None or (length is not None and int(length) < STREAM_PARSE_MIN_BYTES):
+        return json_loads(await response.aread())
+
+    data: Dict[str, Any] = {"features": []}
+    builder = None
+    events = ijson.parse_async(_AsyncByteReader(response.aiter_bytes()), use_float=True)
+
+    async for prefix, event, value in events:
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == "features.item" and event == "end_map":
+                data["features"].append(builder.value)
+                builder = None
+        elif prefix == "features.item" and event == "start_map":
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+        elif prefix == "error":
+            data["error"] = True
+        elif prefix == "exceededTransferLimit":
+            data["exceededTransferLimit"] = value
+        elif prefix == "properties.exceededTransferLimit":
+            data["properties"] = {"exceededTransferLimit": value}
+
+    return data
+
+
+def _boundary_shape(parcel: Dict[str, Any]) -> Optional[shapely.Geometry]:
+    """Shapely geometry of a parsed parcel's boundary, if it has one."""
+    boundary = parcel.get("boundary")
+    if not boundary or not boundary.get("geometry"):
+        return None
+    return shape(boundary["geometry"])
+
+
+def _boundary_feature(geometry: Optional[dict]) -> Optional[dict]:
+    """Wrap a GeoJSON geometry as the bare Feature parcels carry as boundary."""
+    if not geometry:
+        return None
+    return {"type": "Feature", "geometry": geometry, "properties": {}}
+
 
 class ParcelService:
     """Service for retrieving parcel data from county GIS systems."""
@@ -34,7 +227,109 @@ class ParcelService:
 
         self.timeout = httpx.Timeout(30.0)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+        # One pooled client for the service lifetime so back-to-back county
+        # queries reuse keep-alive connections instead of new TLS handshakes
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                # httpx drops idle connections after 5s by default, which
+                # loses the pool between user requests; keep them for a minute
+                keepalive_expiry=60.0
+            ),
+            headers={"User-Agent": "LongIslandHistoricalLandSystem/1.0"}
+        )
+
+        # Recent point lookups; clicking around one building hits the same
+        # parcel, and boundaries change far slower than the one-hour TTL
+        self._location_cache = TTLCache(maxsize=10000, ttl=3600)
+
+        # Parcels layer URL -> the attributes its parser reads, and the
+        # resolved outFields once the layer's schema has been fetched
+        self._wanted_fields = {
+            self.suffolk_parcels_url: _SUFFOLK_FIELDS,
+            self.nassau_parcels_url: _NASSAU_FIELDS
+        }
+        self._out_fields: Dict[str, str] = {}
+
+        # Tile -> lookups waiting on the tile's pending batch
+        self._tile_batches: Dict[
+            Tuple[int, int], List[Tuple[float, float, bool, asyncio.Future]]
+        ] = {}
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def _get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> httpx.Response:
+        """
+        GET with retries on transport errors and 5xx responses.
+
+        4xx responses are returned as-is since repeating them can't help.
+        The last response is returned, or the last transport error raised,
+        once RETRY_ATTEMPTS is exhausted. With stream=True the body is left
+        unread and the caller must close the response.
+        """
+        request = self._client.build_request("GET", url, params=params)
+
+        for attempt in range(RETRY_ATTEMPTS):
+            last_attempt = attempt == RETRY_ATTEMPTS - 1
+            try:
+                response = await self._client.send(request, stream=stream)
+            except httpx.TransportError:
+                if last_attempt:
+                    raise
+            else:
+                if response.status_code < 500 or last_attempt:
+                    return response
+                await response.aclose()
+
+            await asyncio.sleep(min(RETRY_BACKOFF_CAP, RETRY_BACKOFF_BASE * 2 ** attempt))
+
+    @asynccontextmanager
+    async def _stream(self, url: str, params: Dict[str, Any]) -> AsyncIterator[httpx.Response]:
+        """Retrying GET whose body is read lazily; closed on exit."""
+        response = await self._get(url, params=params, stream=True)
+        try:
+            yield response
+        finally:
+            await response.aclose()
+
+    async def _get_out_fields(self, parcels_url: str) -> str:
+        """
+        outFields for a parcels layer: the attributes its parser reads.
+
+        Naming a field the layer lacks fails the whole query, so the list
+        is intersected with the layer's schema, fetched once. Falls back
+        to "*" until the schema can be read.
+        """
+        out_fields = self._out_fields.get(parcels_url)
+        if out_fields is not None:
+            return out_fields
+
+        try:
+            response = await self._client.get(parcels_url, params={"f": "json"})
+
+            if response.status_code == 200:
+                layer_fields = {field.get("name") for field in json_loads(response.content).get("fields", [])}
+                present = [name for name in self._wanted_fields[parcels_url] if name in layer_fields]
+                if present:
+                    out_fields = self._out_fields[parcels_url] = ",".join(present)
+                    return out_fields
+
+        except Exception as e:
+            logger.debug(f"Error reading parcel layer schema: {e}")
+
+        return "*"
+
     async def get_parcel_by_location(
         self,
         lat: float,
@@ -46,21 +341,149 @@ class ParcelService:
 
         Queries both Suffolk and Nassau county GIS systems.
         """
-        parcels = []
+        cache_key = (
+            round(lat, LOCATION_CACHE_PRECISION),
+            round(lon, LOCATION_CACHE_PRECISION),
+            include_boundary
+        )
+        cached = self._location_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        parcels = await self._batched_lookup(lat, lon, include_boundary)
+
+        # Empty results may be transient GIS failures, so only hits are cached.
+        # Callers get deep copies, since parcel dicts (and their boundaries)
+        # would otherwise be shared with every later cache hit
+        if parcels:
+            self._location_cache[cache_key] = parcels
+            return copy.deepcopy(parcels)
+
+        return parcels
 
-        # Determine which county based on approximate boundary
-        # Nassau is roughly west of -73.4 longitude
-        if lon > -73.4:
-            # Query Nassau County
-            nassau_parcels = await self._query_nassau_parcels(lat, lon, include_boundary)
-            parcels.extend(nassau_parcels)
+    async def _batched_lookup(
+        self,
+        lat: float,
+        lon: float,
+        include_boundary: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        Look up a point, sharing one GIS query with concurrent nearby lookups.
+
+        The first lookup in a tile schedules a flush after TILE_BATCH_WINDOW;
+        lookups arriving before then join its batch.
+        """
+        tile = (math.floor(lat * 100), math.floor(lon * 100))
+        future = asyncio.get_running_loop().create_future()
+
+        batch = self._tile_batches.get(tile)
+        if batch is None:
+            self._tile_batches[tile] = [(lat, lon, include_boundary, future)]
+            # The flush runs as its own task so a cancelled first caller
+            # doesn't strand the rest of the batch
+            task = asyncio.create_task(self._flush_tile_batch(tile))
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
         else:
-            # Query Suffolk County
-            suffolk_parcels = await self._query_suffolk_parcels(lat, lon, include_boundary)
-            parcels.extend(suffolk_parcels)
+            batch.append((lat, lon, include_boundary, future))
+
+        return await future
+
+    async def _flush_tile_batch(self, tile: Tuple[int, int]):
+        """Resolve every lookup queued for a tile."""
+        await asyncio.sleep(TILE_BATCH_WINDOW)
+        batch = self._tile_batches.pop(tile)
+
+        try:
+            if len(batch) == 1:
+                lat, lon, include_boundary, _ = batch[0]
+                results = [await self._query_point_parcels(lat, lon, include_boundary)]
+            else:
+                results = await self._query_batch_parcels(batch)
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), parcels in zip(batch, results):
+            # A caller may have been cancelled while the batch was in flight
+            if not future.done():
+                future.set_result(parcels)
+
+    async def _query_point_parcels(
+        self,
+        lat: float,
+        lon: float,
+        include_boundary: bool
+    ) -> List[Dict[str, Any]]:
+        """Query both counties for the parcels at a single point."""
+        parcels = []
+
+        # Ask both counties at once rather than guessing from a meridian;
+        # only the county containing the point returns features
+        results = await asyncio.gather(
+            asyncio.wait_for(
+                self._query_nassau_parcels(lat, lon, include_boundary),
+                timeout=COUNTY_QUERY_TIMEOUT
+            ),
+            asyncio.wait_for(
+                self._query_suffolk_parcels(lat, lon, include_boundary),
+                timeout=COUNTY_QUERY_TIMEOUT
+            ),
+            return_exceptions=True
+        )
+
+        for county_parcels in results:
+            if isinstance(county_parcels, Exception):
+                logger.error(f"County parcel query failed: {county_parcels!r}")
+                continue
+            parcels.extend(county_parcels)
 
         return parcels
 
+    async def _query_batch_parcels(
+        self,
+        batch: List[Tuple[float, float, bool, asyncio.Future]]
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Answer several point lookups with one envelope query per county.
+
+        Candidates are matched to points locally. If the envelope query
+        fails or is truncated, each point falls back to its own query.
+        """
+        lats = [entry[0] for entry in batch]
+        lons = [entry[1] for entry in batch]
+        envelope = (min(lons), min(lats), max(lons), max(lats))
+
+        results = await asyncio.gather(
+            self._query_envelope(self.nassau_parcels_url, envelope, self._parse_nassau_response),
+            self._query_envelope(self.suffolk_parcels_url, envelope, self._parse_suffolk_response)
+        )
+
+        if any(county_parcels is None for county_parcels in results):
+            return await asyncio.gather(*(
+                self._query_point_parcels(lat, lon, include_boundary)
+                for lat, lon, include_boundary, _ in batch
+            ))
+
+        candidates = [
+            (parcel, _boundary_shape(parcel))
+            for county_parcels in results
+            for parcel in county_parcels
+        ]
+
+        matches = []
+        for lat, lon, include_boundary, _ in batch:
+            hits = [
+                parcel if include_boundary else {**parcel, "boundary": None}
+                for parcel, boundary in candidates
+                if boundary is not None and shapely.intersects_xy(boundary, lon, lat)
+            ]
+            matches.append(hits)
+
+        return matches
+
     async def _query_suffolk_parcels(
         self,
         lat: float,
@@ -69,29 +492,19 @@ class ParcelService:
     ) -> List[Dict[str, Any]]:
         """Query Suffolk County GIS for parcel data."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Use ArcGIS REST API query
-                params = {
-                    "f": "json",
-                    "geometry": f"{lon},{lat}",
-                    "geometryType": "esriGeometryPoint",
-                    "spatialRel": "esriSpatialRelIntersects",
-                    "outFields": "*",
-                    "returnGeometry": str(include_boundary).lower(),
-                    "outSR": "4326"
-                }
-
-                response = await client.get(
-                    f"{self.suffolk_parcels_url}/query",
-                    params=params
-                )
+            # Use ArcGIS REST API query
+            params = _POINT_QUERY_PARAMS | {
+                "geometry": f"{lon},{lat}",
+                "outFields": await self._get_out_fields(self.suffolk_parcels_url),
+                "returnGeometry": "true" if include_boundary else "false"
+            }
 
+            async with self._stream(f"{self.suffolk_parcels_url}/query", params) as response:
                 if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_suffolk_response(data)
-                else:
-                    logger.warning(f"Suffolk GIS returned status {response.status_code}")
-                    return await self._get_suffolk_fallback(lat, lon)
+                    return self._parse_suffolk_response(await _read_geojson(response))
+                logger.warning(f"Suffolk GIS returned status {response.status_code}")
+
+            return await self._get_suffolk_fallback(lat, lon)
 
         except Exception as e:
             logger.error(f"Error querying Suffolk GIS: {e}")
@@ -105,87 +518,87 @@ class ParcelService:
     ) -> List[Dict[str, Any]]:
         """Query Nassau County GIS for parcel data."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "f": "json",
-                    "geometry": f"{lon},{lat}",
-                    "geometryType": "esriGeometryPoint",
-                    "spatialRel": "esriSpatialRelIntersects",
-                    "outFields": "*",
-                    "returnGeometry": str(include_boundary).lower(),
-                    "outSR": "4326"
-                }
-
-                response = await client.get(
-                    f"{self.nassau_parcels_url}/query",
-                    params=params
-                )
+            params = _POINT_QUERY_PARAMS | {
+                "geometry": f"{lon},{lat}",
+                "outFields": await self._get_out_fields(self.nassau_parcels_url),
+                "returnGeometry": "true" if include_boundary else "false"
+            }
 
+            async with self._stream(f"{self.nassau_parcels_url}/query", params) as response:
                 if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_nassau_response(data)
-                else:
-                    logger.warning(f"Nassau GIS returned status {response.status_code}")
-                    return []
+                    return self._parse_nassau_response(await _read_geojson(response))
+                logger.warning(f"Nassau GIS returned status {response.status_code}")
+                return []
 
         except Exception as e:
             logger.error(f"Error querying Nassau GIS: {e}")
             return []
 
+    async def _query_envelope(
+        self,
+        parcels_url: str,
+        envelope: Tuple[float, float, float, float],
+        parse: Callable[[dict], List[Dict[str, Any]]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Query one county for every parcel intersecting an envelope.
+
+        Returns None on failure or when the server truncated the result,
+        so callers can fall back to point queries.
+        """
+        try:
+            params = _ENVELOPE_QUERY_PARAMS | {
+                "geometry": ",".join(str(v) for v in envelope),
+                "outFields": await self._get_out_fields(parcels_url)
+            }
+
+            async with self._stream(f"{parcels_url}/query", params) as response:
+                if response.status_code == 200:
+                    data = await _read_geojson(response)
+                    # GeoJSON output may flag truncation at the top level or
+                    # under "properties", depending on server version
+                    truncated = (
+                        data.get("exceededTransferLimit")
+                        or data.get("properties", {}).get("exceededTransferLimit")
+                    )
+                    if "error" not in data and not truncated:
+                        return parse(data)
+                else:
+                    logger.warning(f"Envelope query returned status {response.status_code}")
+
+        except Exception as e:
+            logger.error(f"Error querying parcels by envelope: {e}")
+
+        return None
+
     def _parse_suffolk_response(self, data: dict) -> List[Dict[str, Any]]:
-        """Parse Suffolk County GIS response into standardized format."""
+        """Parse a Suffolk County GIS GeoJSON response into standardized format."""
         parcels = []
 
         for feature in data.get("features", []):
-            attrs = feature.get("attributes", {})
-            geometry = feature.get("geometry", {})
-
-            parcel = {
-                "sbl": attrs.get("SBL") or attrs.get("TAX_MAP_ID", ""),
-                "address": self._format_address(attrs),
-                "municipality": attrs.get("TOWN") or attrs.get("MUNICIPALITY", ""),
-                "county": "Suffolk",
-                "owner_name": attrs.get("OWNER") or attrs.get("OWNER_NAME"),
-                "acreage": attrs.get("ACREAGE") or attrs.get("ACRES"),
-                "land_use_code": attrs.get("PROP_CLASS") or attrs.get("LAND_USE"),
-                "land_use_description": attrs.get("PROP_CLASS_DESC"),
-                "year_built": attrs.get("YEAR_BUILT"),
-                "assessed_value": attrs.get("TOTAL_ASSESSED_VALUE"),
-                "deed_book": attrs.get("DEED_BOOK"),
-                "deed_page": attrs.get("DEED_PAGE"),
-                "deed_date": attrs.get("DEED_DATE"),
-                "boundary": self._convert_geometry(geometry) if geometry else None,
-                "centroid": {"lat": attrs.get("LAT"), "lon": attrs.get("LON")}
-            }
+            attrs = feature.get("properties") or {}
+
+            parcel = _extract_attributes(attrs, _SUFFOLK_FIELD_MAP)
+            parcel["address"] = self._format_address(attrs)
+            parcel["county"] = "Suffolk"
+            parcel["boundary"] = _boundary_feature(feature.get("geometry"))
+            parcel["centroid"] = {"lat": attrs.get("LAT"), "lon": attrs.get("LON")}
             parcels.append(parcel)
 
         return parcels
 
     def _parse_nassau_response(self, data: dict) -> List[Dict[str, Any]]:
-        """Parse Nassau County GIS response into standardized format."""
+        """Parse a Nassau County GIS GeoJSON response into standardized format."""
         parcels = []
 
         for feature in data.get("features", []):
-            attrs = feature.get("attributes", {})
-            geometry = feature.get("geometry", {})
-
-            parcel = {
-                "sbl": attrs.get("SBL") or attrs.get("PRINT_KEY", ""),
-                "address": self._format_address(attrs),
-                "municipality": attrs.get("CITY") or attrs.get("VILLAGE", ""),
-                "county": "Nassau",
-                "owner_name": attrs.get("OWNER"),
-                "acreage": attrs.get("ACRES"),
-                "land_use_code": attrs.get("PROP_CLASS"),
-                "land_use_description": attrs.get("PROP_CLASS_DESC"),
-                "year_built": attrs.get("YR_BLT"),
-                "assessed_value": attrs.get("ASSESSED_VALUE"),
-                "deed_book": attrs.get("DEED_BOOK"),
-                "deed_page": attrs.get("DEED_PAGE"),
-                "deed_date": attrs.get("DEED_DATE"),
-                "boundary": self._convert_geometry(geometry) if geometry else None,
-                "centroid": None
-            }
+            attrs = feature.get("properties") or {}
+
+            parcel = _extract_attributes(attrs, _NASSAU_FIELD_MAP)
+            parcel["address"] = self._format_address(attrs)
+            parcel["county"] = "Nassau"
+            parcel["boundary"] = _boundary_feature(feature.get("geometry"))
+            parcel["centroid"] = None
             parcels.append(parcel)
 
         return parcels
@@ -208,36 +621,21 @@ class ParcelService:
 
         return " ".join(parts) or attrs.get("ADDRESS", "")
 
-    def _convert_geometry(self, geometry: dict) -> dict:
-        """Convert ArcGIS geometry to GeoJSON format."""
-        if "rings" in geometry:
-            # Polygon geometry
-            return {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Polygon",
-                    "coordinates": geometry["rings"]
-                },
-                "properties": {}
-            }
-        return None
-
     async def _get_suffolk_fallback(self, lat: float, lon: float) -> List[Dict[str, Any]]:
         """Fallback method using Suffolk Open Data API."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Query Suffolk Open Data Portal
-                response = await client.get(
-                    f"{self.suffolk_opendata_url}/parcels",
-                    params={
-                        "lat": lat,
-                        "lon": lon,
-                        "format": "json"
-                    }
-                )
+            # Query Suffolk Open Data Portal
+            response = await self._get(
+                f"{self.suffolk_opendata_url}/parcels",
+                params={
+                    "lat": lat,
+                    "lon": lon,
+                    "format": "json"
+                }
+            )
 
-                if response.status_code == 200:
-                    return response.json().get("parcels", [])
+            if response.status_code == 200:
+                return json_loads(response.content).get("parcels", [])
 
         except Exception as e:
             logger.error(f"Fallback query failed: {e}")
@@ -250,66 +648,87 @@ class ParcelService:
         include_boundary: bool = True
     ) -> List[Dict[str, Any]]:
         """Get parcel by Section-Block-Lot number."""
+        if not _SBL_PATTERN.match(sbl):
+            # Not an SBL in either county's format; don't send it to ArcGIS
+            logger.warning(f"Rejecting malformed SBL: {sbl!r}")
+            return []
+
         # Determine county from SBL format
-        if len(sbl.split("-")) == 4:
-            # Suffolk format
-            return await self._query_suffolk_by_sbl(sbl, include_boundary)
+        if _is_suffolk_sbl(sbl):
+            return await self._query_suffolk_by_sbls([sbl], include_boundary)
         else:
-            # Nassau format
-            return await self._query_nassau_by_sbl(sbl, include_boundary)
+            return await self._query_nassau_by_sbls([sbl], include_boundary)
 
-    async def _query_suffolk_by_sbl(
+    async def get_parcels_by_sbls(
         self,
-        sbl: str,
+        sbls: List[str],
+        include_boundary: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Get parcels for many Section-Block-Lot numbers at once.
+
+        SBLs are grouped by county and sent SBL_BATCH_SIZE at a time in
+        `IN (...)` queries, all concurrently. Malformed SBLs are skipped.
+        """
+        suffolk_sbls = []
+        nassau_sbls = []
+
+        for sbl in dict.fromkeys(sbls):
+            if not _SBL_PATTERN.match(sbl):
+                logger.warning(f"Rejecting malformed SBL: {sbl!r}")
+                continue
+            (suffolk_sbls if _is_suffolk_sbl(sbl) else nassau_sbls).append(sbl)
+
+        queries = [
+            self._query_suffolk_by_sbls(suffolk_sbls[i:i + SBL_BATCH_SIZE], include_boundary)
+            for i in range(0, len(suffolk_sbls), SBL_BATCH_SIZE)
+        ] + [
+            self._query_nassau_by_sbls(nassau_sbls[i:i + SBL_BATCH_SIZE], include_boundary)
+            for i in range(0, len(nassau_sbls), SBL_BATCH_SIZE)
+        ]
+
+        results = await asyncio.gather(*queries)
+        return [parcel for batch in results for parcel in batch]
+
+    async def _query_suffolk_by_sbls(
+        self,
+        sbls: List[str],
         include_boundary: bool
     ) -> List[Dict[str, Any]]:
-        """Query Suffolk County by SBL."""
+        """Query Suffolk County for a batch of SBLs."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "f": "json",
-                    "where": f"SBL = '{sbl}'",
-                    "outFields": "*",
-                    "returnGeometry": str(include_boundary).lower(),
-                    "outSR": "4326"
-                }
-
-                response = await client.get(
-                    f"{self.suffolk_parcels_url}/query",
-                    params=params
-                )
+            params = _BASE_QUERY_PARAMS | {
+                "where": f"SBL IN ({_sql_in_list(sbls)})",
+                "outFields": await self._get_out_fields(self.suffolk_parcels_url),
+                "returnGeometry": "true" if include_boundary else "false"
+            }
 
+            async with self._stream(f"{self.suffolk_parcels_url}/query", params) as response:
                 if response.status_code == 200:
-                    return self._parse_suffolk_response(response.json())
+                    return self._parse_suffolk_response(await _read_geojson(response))
 
         except Exception as e:
             logger.error(f"Error querying by SBL: {e}")
 
         return []
 
-    async def _query_nassau_by_sbl(
+    async def _query_nassau_by_sbls(
         self,
-        sbl: str,
+        sbls: List[str],
         include_boundary: bool
     ) -> List[Dict[str, Any]]:
-        """Query Nassau County by SBL."""
+        """Query Nassau County for a batch of SBLs or print keys."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                params = {
-                    "f": "json",
-                    "where": f"SBL = '{sbl}' OR PRINT_KEY = '{sbl}'",
-                    "outFields": "*",
-                    "returnGeometry": str(include_boundary).lower(),
-                    "outSR": "4326"
-                }
-
-                response = await client.get(
-                    f"{self.nassau_parcels_url}/query",
-                    params=params
-                )
+            values = _sql_in_list(sbls)
+            params = _BASE_QUERY_PARAMS | {
+                "where": f"SBL IN ({values}) OR PRINT_KEY IN ({values})",
+                "outFields": await self._get_out_fields(self.nassau_parcels_url),
+                "returnGeometry": "true" if include_boundary else "false"
+            }
 
+            async with self._stream(f"{self.nassau_parcels_url}/query", params) as response:
                 if response.status_code == 200:
-                    return self._parse_nassau_response(response.json())
+                    return self._parse_nassau_response(await _read_geojson(response))
 
         except Exception as e:
             logger.error(f"Error querying Nassau by SBL: {e}")
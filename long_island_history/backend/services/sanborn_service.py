@@ -14,16 +14,270 @@ Sources:
 - Local library collections
 """
 
+import copy
 import logging
-from typing import Optional, List, Dict, Any
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Mapping, NamedTuple, Tuple
+from urllib.parse import quote_plus
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import numpy as np
+from cachetools import LRUCache
 
 logger = logging.getLogger(__name__)
 
+# Decimal places lat/lon are rounded to for cache keys (~110m); nearby
+# clicks share an entry and coverage lookups are ten times coarser
+MAP_CACHE_PRECISION = 3
+
+
+class MapInfo(NamedTuple):
+    """One Sanborn atlas edition for a municipality, with its derived strings."""
+    year: int
+    sheets: int
+    map_id: str
+    loc_url: str
+    notes: str
+
+
+def _build_loc_url(municipality: str, year: int) -> str:
+    """Build Library of Congress search URL."""
+    return f"https://www.loc.gov/collections/sanborn-maps/?q={quote_plus(f'{municipality} new york {year}')}"
+
+
+# Known Sanborn coverage for Long Island as (year, sheets) per edition
+_COVERAGE_RAW: Mapping[str, Tuple[Tuple[int, int], ...]] = {
+    # Suffolk County
+    "amityville": (
+        (1893, 2),
+        (1898, 3),
+        (1904, 4),
+        (1910, 5),
+        (1921, 8)
+    ),
+    "babylon": (
+        (1886, 1),
+        (1893, 2),
+        (1898, 3),
+        (1910, 4),
+        (1921, 6)
+    ),
+    "bay shore": (
+        (1893, 3),
+        (1898, 4),
+        (1904, 6),
+        (1910, 8),
+        (1921, 12),
+        (1930, 16)
+    ),
+    "huntington": (
+        (1886, 2),
+        (1893, 4),
+        (1898, 5),
+        (1910, 8),
+        (1921, 12)
+    ),
+    "islip": (
+        (1898, 2),
+        (1910, 3)
+    ),
+    "northport": (
+        (1886, 1),
+        (1898, 2),
+        (1910, 3),
+        (1921, 4)
+    ),
+    "patchogue": (
+        (1886, 2),
+        (1893, 3),
+        (1898, 4),
+        (1910, 7),
+        (1921, 10)
+    ),
+    "port jefferson": (
+        (1886, 1),
+        (1898, 2),
+        (1910, 3)
+    ),
+    "riverhead": (
+        (1886, 1),
+        (1898, 2),
+        (1910, 3),
+        (1921, 5)
+    ),
+    "sag harbor": (
+        (1884, 2),
+        (1898, 3),
+        (1910, 3)
+    ),
+    "sayville": (
+        (1893, 2),
+        (1898, 2),
+        (1910, 3)
+    ),
+    # Nassau County
+    "freeport": (
+        (1893, 2),
+        (1898, 4),
+        (1910, 8),
+        (1921, 15),
+        (1930, 22)
+    ),
+    "glen cove": (
+        (1886, 2),
+        (1893, 3),
+        (1898, 4),
+        (1910, 7),
+        (1921, 10)
+    ),
+    "hempstead": (
+        (1886, 3),
+        (1893, 5),
+        (1898, 7),
+        (1910, 12),
+        (1921, 18)
+    ),
+    "long beach": (
+        (1910, 3),
+        (1921, 8),
+        (1930, 14)
+    ),
+    "mineola": (
+        (1898, 2),
+        (1910, 4),
+        (1921, 7)
+    ),
+    "oyster bay": (
+        (1886, 1),
+        (1898, 2),
+        (1910, 3)
+    ),
+    "rockville centre": (
+        (1898, 2),
+        (1910, 5),
+        (1921, 9)
+    ),
+    "sea cliff": (
+        (1893, 2),
+        (1898, 2),
+        (1910, 3)
+    )
+}
+
+# Coverage with every edition's map_id, URL and notes built once at import,
+# shared by every service instance
+_COVERAGE: Mapping[str, Tuple[MapInfo, ...]] = MappingProxyType({
+    muni: tuple(
+        MapInfo(
+            year,
+            sheets,
+            f"sanborn_{muni.replace(' ', '_')}_{year}",
+            _build_loc_url(muni.title(), year),
+            f"Sanborn Fire Insurance Map, {year}. {sheets} sheet(s)."
+        )
+        for year, sheets in editions
+    )
+    for muni, editions in _COVERAGE_RAW.items()
+})
+
+# Places with Sanborn coverage that fall in Nassau; everything else is Suffolk
+_NASSAU_PLACES = frozenset({
+    "freeport", "glen cove", "hempstead", "long beach",
+    "mineola", "oyster bay", "rockville centre", "sea cliff",
+    "garden city", "great neck"
+})
+
+# Approximate coordinates for Long Island municipalities as (lat, lon)
+_MUNICIPALITY_COORDS: Mapping[str, Tuple[float, float]] = MappingProxyType({
+    "bay shore": (40.7251, -73.2454),
+    "babylon": (40.6956, -73.3257),
+    "huntington": (40.8682, -73.4257),
+    "patchogue": (40.7654, -73.0151),
+    "riverhead": (40.9170, -72.6620),
+    "freeport": (40.6576, -73.5832),
+    "hempstead": (40.7062, -73.6187),
+    "glen cove": (40.8623, -73.6332)
+})
+
+# Municipality centers as parallel lat/lon arrays so a nearby lookup is
+# one vectorised distance pass rather than a Python loop
+_MUNICIPALITY_NAMES = tuple(_MUNICIPALITY_COORDS)
+_MUNICIPALITY_LAT = np.array([lat for lat, _ in _MUNICIPALITY_COORDS.values()], dtype=np.float64)
+_MUNICIPALITY_LON = np.array([lon for _, lon in _MUNICIPALITY_COORDS.values()], dtype=np.float64)
+
+# Nearby radius of 0.1 degrees (approximately 10km), squared
+_NEARBY_DIST_SQ = 0.1 ** 2
+
+
+# Static parts of every map details response; only the map-specific fields
+# and the Library of Congress link are built per map. Responses hand out
+# deep copies, so callers can't alter these for later requests
+_PROQUEST_NOTE = "Full resolution images may be available through ProQuest Digital Sanborn Maps (institutional access required)"
+
+_INTERPRETATION_GUIDE: Dict[str, str] = {
+    "pink": "Brick construction",
+    "yellow": "Frame (wood) construction",
+    "blue": "Stone construction",
+    "brown": "Adobe or special construction",
+    "green": "Iron or steel construction"
+}
+
+_USAGE_NOTES = (
+    "Sanborn maps show building footprints, construction materials, "
+    "number of stories, and building use. They are invaluable for "
+    "understanding historical development patterns and individual "
+    "building histories."
+)
+
+_STATIC_ACCESS_OPTIONS: Tuple[Dict[str, str], ...] = (
+    {
+        "source": "ProQuest Digital Sanborn Maps",
+        "url": "https://www.proquest.com/products-services/sanborn.html",
+        "access": "Subscription required (many libraries provide access)",
+        "resolution": "High"
+    },
+    {
+        "source": "Local Public Library",
+        "note": "Many Long Island libraries have physical Sanborn collections",
+        "access": "Free with library card"
+    }
+)
+
+_SANBORN_LEGEND: Dict[str, Any] = {
+    "colors": {
+        "pink": "Brick construction",
+        "yellow": "Frame (wood) construction",
+        "blue": "Stone construction",
+        "brown": "Adobe or special construction",
+        "green": "Iron, steel, or concrete construction",
+        "gray": "Fireproof construction"
+    },
+    "symbols": {
+        "D": "Dwelling",
+        "S": "Store",
+        "O": "Office",
+        "AUTO": "Automobile-related",
+        "GAR": "Garage",
+        "SHD": "Shed",
+        "STABLE": "Stable/barn",
+        "OP": "Open (no roof)",
+        "SKY LT": "Skylight",
+        "F.E.": "Fire escape",
+        "F.A.": "Fire alarm"
+    },
+    "numbers": {
+        "roof_number": "Number of stories",
+        "basement": "B or BSMT indicates basement"
+    }
+}
+
 
 class SanbornMapService:
-    """Service for accessing Sanborn Fire Insurance Maps."""
+    """
+    Service for accessing Sanborn Fire Insurance Maps.
+
+    Coverage is held in memory, so lookups are plain methods rather than
+    coroutines; only methods that make HTTP requests should be async.
+    """
 
     def __init__(self):
         # Library of Congress Sanborn Maps API
@@ -31,131 +285,15 @@ class SanbornMapService:
         self.loc_api_url = "https://www.loc.gov/collections/sanborn-maps/"
 
         # Known Sanborn coverage for Long Island
-        self.long_island_coverage = self._initialize_coverage()
+        self.long_island_coverage = _COVERAGE
 
         self.timeout = httpx.Timeout(30.0)
 
-    def _initialize_coverage(self) -> Dict[str, List[Dict[str, Any]]]:
-        """Initialize known Sanborn map coverage for Long Island."""
-        return {
-            # Suffolk County
-            "amityville": [
-                {"year": 1893, "sheets": 2},
-                {"year": 1898, "sheets": 3},
-                {"year": 1904, "sheets": 4},
-                {"year": 1910, "sheets": 5},
-                {"year": 1921, "sheets": 8}
-            ],
-            "babylon": [
-                {"year": 1886, "sheets": 1},
-                {"year": 1893, "sheets": 2},
-                {"year": 1898, "sheets": 3},
-                {"year": 1910, "sheets": 4},
-                {"year": 1921, "sheets": 6}
-            ],
-            "bay shore": [
-                {"year": 1893, "sheets": 3},
-                {"year": 1898, "sheets": 4},
-                {"year": 1904, "sheets": 6},
-                {"year": 1910, "sheets": 8},
-                {"year": 1921, "sheets": 12},
-                {"year": 1930, "sheets": 16}
-            ],
-            "huntington": [
-                {"year": 1886, "sheets": 2},
-                {"year": 1893, "sheets": 4},
-                {"year": 1898, "sheets": 5},
-                {"year": 1910, "sheets": 8},
-                {"year": 1921, "sheets": 12}
-            ],
-            "islip": [
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 3}
-            ],
-            "northport": [
-                {"year": 1886, "sheets": 1},
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 3},
-                {"year": 1921, "sheets": 4}
-            ],
-            "patchogue": [
-                {"year": 1886, "sheets": 2},
-                {"year": 1893, "sheets": 3},
-                {"year": 1898, "sheets": 4},
-                {"year": 1910, "sheets": 7},
-                {"year": 1921, "sheets": 10}
-            ],
-            "port jefferson": [
-                {"year": 1886, "sheets": 1},
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 3}
-            ],
-            "riverhead": [
-                {"year": 1886, "sheets": 1},
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 3},
-                {"year": 1921, "sheets": 5}
-            ],
-            "sag harbor": [
-                {"year": 1884, "sheets": 2},
-                {"year": 1898, "sheets": 3},
-                {"year": 1910, "sheets": 3}
-            ],
-            "sayville": [
-                {"year": 1893, "sheets": 2},
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 3}
-            ],
-            # Nassau County
-            "freeport": [
-                {"year": 1893, "sheets": 2},
-                {"year": 1898, "sheets": 4},
-                {"year": 1910, "sheets": 8},
-                {"year": 1921, "sheets": 15},
-                {"year": 1930, "sheets": 22}
-            ],
-            "glen cove": [
-                {"year": 1886, "sheets": 2},
-                {"year": 1893, "sheets": 3},
-                {"year": 1898, "sheets": 4},
-                {"year": 1910, "sheets": 7},
-                {"year": 1921, "sheets": 10}
-            ],
-            "hempstead": [
-                {"year": 1886, "sheets": 3},
-                {"year": 1893, "sheets": 5},
-                {"year": 1898, "sheets": 7},
-                {"year": 1910, "sheets": 12},
-                {"year": 1921, "sheets": 18}
-            ],
-            "long beach": [
-                {"year": 1910, "sheets": 3},
-                {"year": 1921, "sheets": 8},
-                {"year": 1930, "sheets": 14}
-            ],
-            "mineola": [
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 4},
-                {"year": 1921, "sheets": 7}
-            ],
-            "oyster bay": [
-                {"year": 1886, "sheets": 1},
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 3}
-            ],
-            "rockville centre": [
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 5},
-                {"year": 1921, "sheets": 9}
-            ],
-            "sea cliff": [
-                {"year": 1893, "sheets": 2},
-                {"year": 1898, "sheets": 2},
-                {"year": 1910, "sheets": 3}
-            ]
-        }
+        # Coverage is static, so answers only ever leave by eviction
+        self._available_cache = LRUCache(maxsize=1024)
+        self._details_cache = LRUCache(maxsize=512)
 
-    async def get_available_maps(
+    def get_available_maps(
         self,
         lat: float,
         lon: float,
@@ -164,88 +302,74 @@ class SanbornMapService:
         """
         Get available Sanborn maps for a location.
         """
-        available_maps = []
+        lat = round(lat, MAP_CACHE_PRECISION)
+        lon = round(lon, MAP_CACHE_PRECISION)
+        cache_key = (lat, lon, municipality)
+        cached = self._available_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
 
         # Find matching municipality
-        if municipality:
-            muni_key = municipality.lower()
-            if muni_key in self.long_island_coverage:
-                for map_info in self.long_island_coverage[muni_key]:
-                    available_maps.append(
-                        self._create_map_entry(municipality, map_info)
-                    )
+        coverage = self.long_island_coverage.get(municipality.lower(), ()) if municipality else ()
+        available_maps = [
+            self._create_map_entry(municipality, map_info)
+            for map_info in coverage
+        ]
 
         # If no municipality specified, try to find nearby coverage
         if not available_maps:
-            nearby = self._find_nearby_coverage(lat, lon)
-            for muni, maps in nearby.items():
-                for map_info in maps:
-                    available_maps.append(
-                        self._create_map_entry(muni.title(), map_info)
-                    )
+            available_maps = [
+                self._create_map_entry(muni.title(), map_info)
+                for muni, maps in self._find_nearby_coverage(lat, lon).items()
+                for map_info in maps
+            ]
 
-        return available_maps
+        # Callers get their own copies so edits can't reach the cached entries
+        self._available_cache[cache_key] = available_maps
+        return copy.deepcopy(available_maps)
 
-    def _create_map_entry(self, municipality: str, map_info: dict) -> Dict[str, Any]:
+    def _create_map_entry(self, municipality: str, map_info: MapInfo) -> Dict[str, Any]:
         """Create a standardized map entry."""
-        year = map_info["year"]
-
         return {
-            "map_id": f"sanborn_{municipality.lower().replace(' ', '_')}_{year}",
+            "map_id": map_info.map_id,
             "city": municipality,
             "county": self._get_county(municipality),
-            "year": year,
+            "year": map_info.year,
             "volume": "1",
-            "sheet": f"1-{map_info.get('sheets', 1)}",
+            "sheet": f"1-{map_info.sheets}",
             "coverage_area": f"{municipality}, NY",
-            "url": self._build_loc_url(municipality, year),
+            "url": map_info.loc_url,
             "thumbnail_url": None,
-            "notes": f"Sanborn Fire Insurance Map, {year}. {map_info.get('sheets', 1)} sheet(s)."
+            "notes": map_info.notes
         }
 
-    def _build_loc_url(self, municipality: str, year: int) -> str:
-        """Build Library of Congress search URL."""
-        query = f"{municipality} new york {year}"
-        return f"https://www.loc.gov/collections/sanborn-maps/?q={query.replace(' ', '+')}"
-
     def _get_county(self, municipality: str) -> str:
         """Determine county from municipality name."""
-        nassau_places = [
-            "freeport", "glen cove", "hempstead", "long beach",
-            "mineola", "oyster bay", "rockville centre", "sea cliff",
-            "garden city", "great neck"
-        ]
-
-        if municipality.lower() in nassau_places:
-            return "Nassau"
-        return "Suffolk"
+        return "Nassau" if municipality.lower() in _NASSAU_PLACES else "Suffolk"
 
-    def _find_nearby_coverage(self, lat: float, lon: float) -> Dict[str, List]:
+    def _find_nearby_coverage(self, lat: float, lon: float) -> Dict[str, Tuple[MapInfo, ...]]:
         """Find Sanborn coverage near a location."""
-        # Approximate coordinates for Long Island municipalities
-        municipality_coords = {
-            "bay shore": (40.7251, -73.2454),
-            "babylon": (40.6956, -73.3257),
-            "huntington": (40.8682, -73.4257),
-            "patchogue": (40.7654, -73.0151),
-            "riverhead": (40.9170, -72.6620),
-            "freeport": (40.6576, -73.5832),
-            "hempstead": (40.7062, -73.6187),
-            "glen cove": (40.8623, -73.6332)
+        dist_sq = (_MUNICIPALITY_LAT - lat) ** 2 + (_MUNICIPALITY_LON - lon) ** 2
+        nearby_names = (_MUNICIPALITY_NAMES[i] for i in np.flatnonzero(dist_sq < _NEARBY_DIST_SQ))
+
+        return {
+            muni: self.long_island_coverage[muni]
+            for muni in nearby_names
+            if muni in self.long_island_coverage
         }
 
-        nearby = {}
-        for muni, coords in municipality_coords.items():
-            distance = ((lat - coords[0]) ** 2 + (lon - coords[1]) ** 2) ** 0.5
-            if distance < 0.1:  # Approximately 10km
-                if muni in self.long_island_coverage:
-                    nearby[muni] = self.long_island_coverage[muni]
+    def get_map_details(self, map_id: str) -> Optional[Dict[str, Any]]:
+        """Get detailed information about a specific Sanborn map."""
+        if map_id in self._details_cache:
+            details = self._details_cache[map_id]
+        else:
+            details = self._build_map_details(map_id)
+            self._details_cache[map_id] = details
 
-        return nearby
+        return copy.deepcopy(details) if details else None
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
-    async def get_map_details(self, map_id: str) -> Optional[Dict[str, Any]]:
-        """Get detailed information about a specific Sanborn map."""
+    def _build_map_details(self, map_id: str) -> Optional[Dict[str, Any]]:
+        """Assemble the details for a map_id, or None if it is unknown."""
         # Parse map_id
         parts = map_id.replace("sanborn_", "").rsplit("_", 1)
         if len(parts) != 2:
@@ -264,13 +388,14 @@ class SanbornMapService:
 
         map_info = None
         for info in self.long_island_coverage[muni_key]:
-            if info["year"] == year:
+            if info.year == year:
                 map_info = info
                 break
 
         if not map_info:
             return None
 
+        loc_url = map_info.loc_url
         return {
             "map_id": map_id,
             "city": municipality,
@@ -279,44 +404,23 @@ class SanbornMapService:
             "year": year,
             "publisher": "Sanborn Map Company",
             "scale": "50 feet to 1 inch (typical)",
-            "sheets": map_info.get("sheets", 1),
-            "library_of_congress_url": self._build_loc_url(municipality, year),
-            "proquest_note": "Full resolution images may be available through ProQuest Digital Sanborn Maps (institutional access required)",
-            "interpretation_guide": {
-                "pink": "Brick construction",
-                "yellow": "Frame (wood) construction",
-                "blue": "Stone construction",
-                "brown": "Adobe or special construction",
-                "green": "Iron or steel construction"
-            },
-            "usage_notes": (
-                "Sanborn maps show building footprints, construction materials, "
-                "number of stories, and building use. They are invaluable for "
-                "understanding historical development patterns and individual "
-                "building histories."
-            ),
+            "sheets": map_info.sheets,
+            "library_of_congress_url": loc_url,
+            "proquest_note": _PROQUEST_NOTE,
+            "interpretation_guide": _INTERPRETATION_GUIDE,
+            "usage_notes": _USAGE_NOTES,
             "access_options": [
                 {
                     "source": "Library of Congress",
-                    "url": self._build_loc_url(municipality, year),
+                    "url": loc_url,
                     "access": "Free online",
                     "resolution": "Medium"
                 },
-                {
-                    "source": "ProQuest Digital Sanborn Maps",
-                    "url": "https://www.proquest.com/products-services/sanborn.html",
-                    "access": "Subscription required (many libraries provide access)",
-                    "resolution": "High"
-                },
-                {
-                    "source": "Local Public Library",
-                    "note": "Many Long Island libraries have physical Sanborn collections",
-                    "access": "Free with library card"
-                }
+                *_STATIC_ACCESS_OPTIONS
             ]
         }
 
-    async def search_by_address(
+    def search_by_address(
         self,
         address: str,
         municipality: str,
@@ -328,54 +432,24 @@ class SanbornMapService:
         Note: This doesn't search within maps (that requires OCR'd indexes),
         but identifies which map volumes would contain the address.
         """
-        results = []
-
-        muni_key = municipality.lower()
-        if muni_key in self.long_island_coverage:
-            maps = self.long_island_coverage[muni_key]
-
-            if year:
-                # Find closest year
-                maps = sorted(maps, key=lambda x: abs(x["year"] - year))
-
-            for map_info in maps[:5]:  # Return up to 5 maps
-                results.append({
-                    **self._create_map_entry(municipality, map_info),
-                    "address_search_note": (
-                        f"This {map_info['year']} Sanborn atlas covers {municipality}. "
-                        f"Search within the {map_info['sheets']} sheet(s) to locate {address}. "
-                        f"Sheets are typically organized by street name alphabetically."
-                    )
-                })
-
-        return results
+        maps = self.long_island_coverage.get(municipality.lower(), ())
+
+        if year:
+            # Find closest year
+            maps = sorted(maps, key=lambda x: abs(x.year - year))
+
+        return [
+            {
+                **self._create_map_entry(municipality, map_info),
+                "address_search_note": (
+                    f"This {map_info.year} Sanborn atlas covers {municipality}. "
+                    f"Search within the {map_info.sheets} sheet(s) to locate {address}. "
+                    f"Sheets are typically organized by street name alphabetically."
+                )
+            }
+            for map_info in maps[:5]  # Return up to 5 maps
+        ]
 
     def get_sanborn_legend(self) -> Dict[str, Any]:
         """Get Sanborn map color/symbol legend."""
-        return {
-            "colors": {
-                "pink": "Brick construction",
-                "yellow": "Frame (wood) construction",
-                "blue": "Stone construction",
-                "brown": "Adobe or special construction",
-                "green": "Iron, steel, or concrete construction",
-                "gray": "Fireproof construction"
-            },
-            "symbols": {
-                "D": "Dwelling",
-                "S": "Store",
-                "O": "Office",
-                "AUTO": "Automobile-related",
-                "GAR": "Garage",
-                "SHD": "Shed",
-                "STABLE": "Stable/barn",
-                "OP": "Open (no roof)",
-                "SKY LT": "Skylight",
-                "F.E.": "Fire escape",
-                "F.A.": "Fire alarm"
-            },
-            "numbers": {
-                "roof_number": "Number of stories",
-                "basement": "B or BSMT indicates basement"
-            }
-        }
+        return copy.deepcopy(_SANBORN_LEGEND)
@@ -8,12 +8,111 @@ Provides access to:
 """
 
 import logging
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 import httpx
-from tenacity import retry, stop_after_attempt, wait_exponential
+import shapely
+from cachetools import TTLCache
+from shapely.strtree import STRtree
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+from services.cache_manager import CacheManager
+from utils.json_utils import json_loads
 
 logger = logging.getLogger(__name__)
 
+# Decimal places lat/lon are rounded to for cache keys (~110m); quadrangles
+# span kilometres, so nearby clicks can share one TNM response
+MAP_CACHE_PRECISION = 3
+
+# Long Island 7.5-minute quadrangles as (name, center lat, center lon)
+_QUADS: Tuple[Tuple[str, float, float], ...] = (
+    # Suffolk County
+    ("ORIENT", 41.1333, -72.3000),
+    ("GREENPORT", 41.0833, -72.3500),
+    ("SOUTHOLD", 41.0500, -72.4167),
+    ("MATTITUCK", 41.0167, -72.5333),
+    ("RIVERHEAD", 40.9333, -72.6667),
+    ("WADING RIVER", 40.9500, -72.8333),
+    ("MIDDLE ISLAND", 40.8833, -72.9500),
+    ("PORT JEFFERSON", 40.9500, -73.0667),
+    ("SAINT JAMES", 40.8667, -73.1500),
+    ("NORTHPORT", 40.9000, -73.3333),
+    ("HUNTINGTON", 40.8667, -73.4167),
+    ("LLOYD HARBOR", 40.9167, -73.4500),
+    ("BAY SHORE EAST", 40.7167, -73.2167),
+    ("BAY SHORE WEST", 40.7167, -73.2833),
+    ("CENTRAL ISLIP", 40.7833, -73.2000),
+    ("PATCHOGUE", 40.7667, -73.0167),
+    ("BELLPORT", 40.7500, -72.9333),
+    ("MORICHES", 40.8000, -72.8167),
+    ("EASTPORT", 40.8333, -72.7333),
+    ("QUOGUE", 40.8167, -72.6167),
+    ("SOUTHAMPTON", 40.8833, -72.3833),
+    ("SAG HARBOR", 41.0000, -72.2833),
+    ("EAST HAMPTON", 41.0000, -72.1833),
+    ("MONTAUK POINT", 41.0667, -71.8667),
+    # Nassau County
+    ("FREEPORT", 40.6500, -73.5833),
+    ("JONES INLET", 40.5833, -73.5667),
+    ("AMITYVILLE", 40.6833, -73.4167),
+    ("HICKSVILLE", 40.7667, -73.5167),
+    ("SEA CLIFF", 40.8500, -73.6500),
+    ("GLEN COVE", 40.8667, -73.6333),
+    ("LYNBROOK", 40.6500, -73.6833)
+)
+
+# Quadrangle centers indexed once for nearest-neighbour lookups
+_QUAD_NAMES = tuple(name for name, _, _ in _QUADS)
+_QUAD_TREE = STRtree(shapely.points([(lon, lat) for _, lat, lon in _QUADS]))
+
+# Fallback maps offered when TNM is unreachable; "{quad}" in a name and the
+# coverage are filled in with the location's quadrangle
+_KNOWN_MAP_TEMPLATES: Tuple[Dict[str, Any], ...] = (
+    {
+        "layer_id": "usgs_topo_current",
+        "name": "USGS US Topo (Current)",
+        "description": "Current USGS topographic map",
+        "year": 2023,
+        "source": "USGS National Map",
+        "coverage": None,
+        "tile_url": "https://basemap.nationalmap.gov/arcgis/rest/services/USGSTopo/MapServer/tile/{z}/{y}/{x}"
+    },
+    {
+        "layer_id": "usgs_historical_1950s",
+        "name": "USGS 7.5-minute {quad} (1950s)",
+        "description": "Historical 7.5-minute quadrangle from the 1950s",
+        "year": 1955,
+        "year_range": "1947-1960",
+        "source": "USGS Historical Topographic Map Collection",
+        "coverage": None
+    },
+    {
+        "layer_id": "usgs_historical_1940s",
+        "name": "USGS 7.5-minute {quad} (1940s)",
+        "description": "Historical wartime survey",
+        "year": 1944,
+        "year_range": "1940-1947",
+        "source": "USGS Historical Topographic Map Collection",
+        "coverage": None
+    },
+    {
+        "layer_id": "usgs_historical_1900s",
+        "name": "USGS 15-minute {quad} (Early 1900s)",
+        "description": "Early 20th century 15-minute series",
+        "year": 1903,
+        "year_range": "1897-1910",
+        "source": "USGS Historical Topographic Map Collection",
+        "coverage": None
+    }
+)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Retry dropped connections and server errors, never client errors."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
 
 class USGSService:
     """Service for retrieving USGS historical topographic maps."""
@@ -23,46 +122,70 @@ class USGSService:
         self.tnm_api_url = "https://tnmaccess.nationalmap.gov/api/v1"
         self.ngmdb_url = "https://ngmdb.usgs.gov/topoview"
 
-        # Long Island quadrangle names
-        self.long_island_quads = {
-            # Suffolk County
-            "ORIENT": {"lat": 41.1333, "lon": -72.3000},
-            "GREENPORT": {"lat": 41.0833, "lon": -72.3500},
-            "SOUTHOLD": {"lat": 41.0500, "lon": -72.4167},
-            "MATTITUCK": {"lat": 41.0167, "lon": -72.5333},
-            "RIVERHEAD": {"lat": 40.9333, "lon": -72.6667},
-            "WADING RIVER": {"lat": 40.9500, "lon": -72.8333},
-            "MIDDLE ISLAND": {"lat": 40.8833, "lon": -72.9500},
-            "PORT JEFFERSON": {"lat": 40.9500, "lon": -73.0667},
-            "SAINT JAMES": {"lat": 40.8667, "lon": -73.1500},
-            "NORTHPORT": {"lat": 40.9000, "lon": -73.3333},
-            "HUNTINGTON": {"lat": 40.8667, "lon": -73.4167},
-            "LLOYD HARBOR": {"lat": 40.9167, "lon": -73.4500},
-            "BAY SHORE EAST": {"lat": 40.7167, "lon": -73.2167},
-            "BAY SHORE WEST": {"lat": 40.7167, "lon": -73.2833},
-            "CENTRAL ISLIP": {"lat": 40.7833, "lon": -73.2000},
-            "PATCHOGUE": {"lat": 40.7667, "lon": -73.0167},
-            "BELLPORT": {"lat": 40.7500, "lon": -72.9333},
-            "MORICHES": {"lat": 40.8000, "lon": -72.8167},
-            "EASTPORT": {"lat": 40.8333, "lon": -72.7333},
-            "QUOGUE": {"lat": 40.8167, "lon": -72.6167},
-            "SOUTHAMPTON": {"lat": 40.8833, "lon": -72.3833},
-            "SAG HARBOR": {"lat": 41.0000, "lon": -72.2833},
-            "EAST HAMPTON": {"lat": 41.0000, "lon": -72.1833},
-            "MONTAUK POINT": {"lat": 41.0667, "lon": -71.8667},
-            # Nassau County
-            "FREEPORT": {"lat": 40.6500, "lon": -73.5833},
-            "JONES INLET": {"lat": 40.5833, "lon": -73.5667},
-            "AMITYVILLE": {"lat": 40.6833, "lon": -73.4167},
-            "HICKSVILLE": {"lat": 40.7667, "lon": -73.5167},
-            "HUNTINGTON": {"lat": 40.8667, "lon": -73.4167},
-            "SEA CLIFF": {"lat": 40.8500, "lon": -73.6500},
-            "GLEN COVE": {"lat": 40.8667, "lon": -73.6333},
-            "LYNBROOK": {"lat": 40.6500, "lon": -73.6833}
-        }
-
         self.timeout = httpx.Timeout(30.0)
 
+        # One pooled client for the service lifetime so repeated TNM
+        # queries reuse keep-alive connections instead of new TLS handshakes
+        self._client = httpx.AsyncClient(
+            timeout=self.timeout,
+            # The transport retries failed connects itself, on the same pool
+            transport=httpx.AsyncHTTPTransport(
+                retries=3,
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=100,
+                    max_keepalive_connections=20,
+                    # httpx drops idle connections after 5s by default, which
+                    # loses the pool between user requests; keep them for a minute
+                    keepalive_expiry=60.0
+                )
+            ),
+            headers={"User-Agent": "LongIslandHistoricalLandSystem/1.0"}
+        )
+
+        # TNM product listings change rarely; an hour keeps repeat map-panel
+        # loads off the API. Only successful queries are stored.
+        self._available_cache = TTLCache(maxsize=1024, ttl=3600)
+        self._topo_cache = TTLCache(maxsize=1024, ttl=3600)
+
+        # Shared response cache (Redis when configured), attached at startup
+        # so listings survive restarts and are shared between workers
+        self.cache: Optional[CacheManager] = None
+
+    async def aclose(self):
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    async def _cache_get(self, prefix: str, local: TTLCache, key: tuple) -> Optional[Any]:
+        """Look a response up in the local cache, then the shared one."""
+        value = local.get(key)
+        if value is None and self.cache is not None:
+            value = await self.cache.get(prefix, *key)
+            if value is not None:
+                local[key] = value
+        return value
+
+    async def _cache_set(self, prefix: str, local: TTLCache, key: tuple, value: Any):
+        """Store a response in the local and shared caches."""
+        local[key] = value
+        if self.cache is not None:
+            await self.cache.set(prefix, value, *key)
+
+    @retry(
+        retry=retry_if_exception(_is_retryable),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, min=0.5, max=5),
+        reraise=True
+    )
+    async def _get_products(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Query the TNM products endpoint, raising on a non-2xx response."""
+        response = await self._client.get(
+            f"{self.tnm_api_url}/products",
+            params=params
+        )
+        response.raise_for_status()
+        return json_loads(response.content)
+
     async def get_available_maps(
         self,
         lat: float,
@@ -71,24 +194,24 @@ class USGSService:
         """
         Get available USGS topographic maps for a location.
         """
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Query the TNM API for historical topos
-                params = {
-                    "datasets": "National Map 2.0",
-                    "prodFormats": "GeoTIFF",
-                    "polygon": self._create_search_polygon(lat, lon),
-                    "outputFormat": "JSON"
-                }
+        cache_key = (round(lat, MAP_CACHE_PRECISION), round(lon, MAP_CACHE_PRECISION))
+        cached = await self._cache_get("usgs_maps", self._available_cache, cache_key)
+        if cached is not None:
+            return list(cached)
 
-                response = await client.get(
-                    f"{self.tnm_api_url}/products",
-                    params=params
-                )
+        try:
+            # Query the TNM API for historical topos
+            params = {
+                "datasets": "National Map 2.0",
+                "prodFormats": "GeoTIFF",
+                "polygon": self._create_search_polygon(lat, lon),
+                "outputFormat": "JSON"
+            }
 
-                if response.status_code == 200:
-                    data = response.json()
-                    return self._parse_tnm_response(data)
+            data = await self._get_products(params)
+            maps = self._parse_tnm_response(data)
+            await self._cache_set("usgs_maps", self._available_cache, cache_key, maps)
+            return list(maps)
 
         except Exception as e:
             logger.error(f"Error querying USGS API: {e}")
@@ -109,10 +232,8 @@ class USGSService:
 
     def _parse_tnm_response(self, data: dict) -> List[Dict[str, Any]]:
         """Parse TNM API response."""
-        maps = []
-
-        for item in data.get("items", []):
-            maps.append({
+        return [
+            {
                 "layer_id": item.get("sourceId", ""),
                 "name": item.get("title", ""),
                 "description": item.get("abstract", ""),
@@ -121,9 +242,9 @@ class USGSService:
                 "coverage": item.get("mapName", ""),
                 "tile_url": item.get("urls", {}).get("tiles"),
                 "download_url": item.get("downloadURL")
-            })
-
-        return maps
+            }
+            for item in data.get("items") or ()
+        ]
 
     def _extract_year(self, date_str: str) -> Optional[int]:
         """Extract year from date string."""
@@ -142,62 +263,20 @@ class USGSService:
         """Return known historical map information for Long Island."""
         # Determine which quadrangle(s) cover this location
         quad_name = self._find_quadrangle(lat, lon)
+        coverage = quad_name or "Long Island"
 
-        base_maps = [
-            {
-                "layer_id": "usgs_topo_current",
-                "name": "USGS US Topo (Current)",
-                "description": "Current USGS topographic map",
-                "year": 2023,
-                "source": "USGS National Map",
-                "coverage": quad_name or "Long Island",
-                "tile_url": "https://basemap.nationalmap.gov/arcgis/rest/services/USGSTopo/MapServer/tile/{z}/{y}/{x}"
-            },
-            {
-                "layer_id": "usgs_historical_1950s",
-                "name": f"USGS 7.5-minute {quad_name} (1950s)",
-                "description": "Historical 7.5-minute quadrangle from the 1950s",
-                "year": 1955,
-                "year_range": "1947-1960",
-                "source": "USGS Historical Topographic Map Collection",
-                "coverage": quad_name or "Long Island"
-            },
-            {
-                "layer_id": "usgs_historical_1940s",
-                "name": f"USGS 7.5-minute {quad_name} (1940s)",
-                "description": "Historical wartime survey",
-                "year": 1944,
-                "year_range": "1940-1947",
-                "source": "USGS Historical Topographic Map Collection",
-                "coverage": quad_name or "Long Island"
-            },
-            {
-                "layer_id": "usgs_historical_1900s",
-                "name": f"USGS 15-minute {quad_name} (Early 1900s)",
-                "description": "Early 20th century 15-minute series",
-                "year": 1903,
-                "year_range": "1897-1910",
-                "source": "USGS Historical Topographic Map Collection",
-                "coverage": quad_name or "Long Island"
-            }
+        return [
+            {**template, "name": template["name"].format(quad=quad_name), "coverage": coverage}
+            for template in _KNOWN_MAP_TEMPLATES
         ]
 
-        return base_maps
-
     def _find_quadrangle(self, lat: float, lon: float) -> Optional[str]:
         """Find the USGS quadrangle name for a location."""
-        min_dist = float('inf')
-        closest_quad = None
-
-        for name, center in self.long_island_quads.items():
-            dist = ((lat - center["lat"]) ** 2 + (lon - center["lon"]) ** 2) ** 0.5
-            if dist < min_dist:
-                min_dist = dist
-                closest_quad = name
+        index = _QUAD_TREE.nearest(shapely.Point(lon, lat))
+        if index is None:
+            return None
+        return _QUAD_NAMES[index]
 
-        return closest_quad
-
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
     async def get_topographic_map(
         self,
         lat: float,
@@ -207,42 +286,46 @@ class USGSService:
         """
         Get a specific historical topographic map.
         """
+        cache_key = (
+            round(lat, MAP_CACHE_PRECISION),
+            round(lon, MAP_CACHE_PRECISION),
+            year
+        )
+        cached = await self._cache_get("usgs_topo", self._topo_cache, cache_key)
+        if cached is not None:
+            return dict(cached)
+
         quad_name = self._find_quadrangle(lat, lon)
 
         # Try to find the specific map
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                # Query historical topo collection
-                params = {
-                    "datasets": "Historical Topographic Maps",
-                    "bbox": f"{lon-0.1},{lat-0.1},{lon+0.1},{lat+0.1}",
-                    "dateType": "dateCreated",
-                    "start": f"{year - 5}-01-01",
-                    "end": f"{year + 5}-12-31",
-                    "outputFormat": "JSON"
-                }
-
-                response = await client.get(
-                    f"{self.tnm_api_url}/products",
-                    params=params
-                )
+            # Query historical topo collection
+            params = {
+                "datasets": "Historical Topographic Maps",
+                "bbox": f"{lon-0.1},{lat-0.1},{lon+0.1},{lat+0.1}",
+                "dateType": "dateCreated",
+                "start": f"{year - 5}-01-01",
+                "end": f"{year + 5}-12-31",
+                "outputFormat": "JSON"
+            }
 
-                if response.status_code == 200:
-                    data = response.json()
-                    items = data.get("items", [])
-
-                    if items:
-                        # Return best match
-                        item = items[0]
-                        return {
-                            "map_id": item.get("sourceId"),
-                            "map_name": item.get("title"),
-                            "quadrangle_name": quad_name,
-                            "year": self._extract_year(item.get("dateCreated")),
-                            "scale": item.get("mapScale", "7.5-minute"),
-                            "download_url": item.get("downloadURL"),
-                            "thumbnail_url": item.get("previewGraphicURL")
-                        }
+            data = await self._get_products(params)
+            items = data.get("items", [])
+
+            if items:
+                # Return best match
+                item = items[0]
+                topo = {
+                    "map_id": item.get("sourceId"),
+                    "map_name": item.get("title"),
+                    "quadrangle_name": quad_name,
+                    "year": self._extract_year(item.get("dateCreated")),
+                    "scale": item.get("mapScale", "7.5-minute"),
+                    "download_url": item.get("downloadURL"),
+                    "thumbnail_url": item.get("previewGraphicURL")
+                }
+                await self._cache_set("usgs_topo", self._topo_cache, cache_key, topo)
+                return dict(topo)
 
         except Exception as e:
             logger.error(f"Error getting USGS map: {e}")
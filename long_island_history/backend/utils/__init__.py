@@ -3,5 +3,6 @@ Utility modules for Long Island Historical Land Information System
 """
 
 from .logger import setup_logging
+from .json_utils import json_loads, json_dumps
 
-__all__ = ['setup_logging']
+__all__ = ['setup_logging', 'json_loads', 'json_dumps']
@@ -0,0 +1,43 @@
+"""
+JSON Utilities
+
+Fast JSON encoding/decoding for large API payloads.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    """Encode NumPy arrays and scalars that the encoder can't handle natively."""
+    if hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_loads(data):
+    """
+    Decode JSON from bytes or str.
+
+    Uses orjson when installed, falling back to the standard library.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> bytes:
+    """
+    Encode an object to compact JSON bytes.
+
+    NumPy arrays are accepted anywhere in obj; orjson encodes them straight
+    from the array buffer. Uses orjson when installed, falling back to the
+    standard library.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(obj, default=_default, separators=(",", ":")).encode("utf-8")
@@ -4,10 +4,94 @@ Logging Configuration
 Sets up structured logging for the application.
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Background thread that formats and writes records queued by the app
+_listener: Optional[QueueListener] = None
+
+
+class _DeferredFormatQueueHandler(QueueHandler):
+    """Queue records unformatted; the listener's handlers format them."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Merge %-args now so later mutation of them can't change the message.
+        # structlog event dicts and exc_info are left for the listener.
+        if not isinstance(record.msg, dict):
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+def _render_json(obj, **kwargs) -> str:
+    """JSON serializer for structlog; orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, **kwargs).decode("utf-8")
+    return json.dumps(obj, **kwargs)
+
+
+def _add_record_timestamp(logger, method_name, event_dict):
+    """
+    Stamp a stdlib record with the time it was logged.
+
+    Foreign records are formatted later on the listener thread, so a
+    TimeStamper there would record when the line was written instead.
+    """
+    record = event_dict["_record"]
+    event_dict["timestamp"] = datetime.fromtimestamp(
+        record.created, tz=timezone.utc
+    ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+    return event_dict
+
+
+def _json_formatter() -> Optional[logging.Formatter]:
+    """
+    Build a formatter rendering every record as one JSON line.
+
+    Records from plain logging.getLogger loggers and from structlog both
+    go through it. Returns None when structlog is not installed.
+    """
+    try:
+        import structlog
+    except ImportError:
+        return None
+
+    pre_chain = [
+        structlog.stdlib.add_log_level,
+        structlog.stdlib.add_logger_name,
+        structlog.processors.TimeStamper(fmt="iso", utc=True),
+    ]
+    structlog.configure(
+        processors=pre_chain + [structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    return structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_render_json),
+        ],
+        foreign_pre_chain=[
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            _add_record_timestamp,
+        ],
+    )
+
 
 def setup_logging(
     level: str = "INFO",
@@ -17,51 +101,51 @@ def setup_logging(
     """
     Set up logging configuration for the application.
 
+    Application code only enqueues records. A listener thread formats them
+    and does the console and file writes, so a burst of logging from many
+    requests never blocks the event loop on I/O.
+
     Args:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         json_format: If True, use JSON structured logging
         log_file: Optional file path for log output
     """
+    global _listener
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, level.upper()))
 
-    # Clear existing handlers
+    # Clear existing handlers, flushing anything a previous setup queued
     root_logger.handlers = []
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
-    # Format
-    if json_format:
-        try:
-            import structlog
-            structlog.configure(
-                processors=[
-                    structlog.processors.TimeStamper(fmt="iso"),
-                    structlog.processors.JSONRenderer()
-                ],
-                wrapper_class=structlog.BoundLogger,
-                context_class=dict,
-                logger_factory=structlog.PrintLoggerFactory(),
-            )
-            return
-        except ImportError:
-            pass  # Fall back to standard logging
-
-    # Standard format
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
-    )
+    # Format; JSON falls back to the standard format without structlog
+    formatter = _json_formatter() if json_format else None
+    if formatter is None:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
 
     # File handler (if specified)
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Route everything through a queue drained by the listener thread
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(_DeferredFormatQueueHandler(log_queue))
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
 
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -72,3 +156,10 @@ def setup_logging(
     # Log startup message
     logger = logging.getLogger(__name__)
     logger.info(f"Logging initialized at {level} level")
+
+
+@atexit.register
+def _stop_listener():
+    """Drain queued records before the interpreter exits."""
+    if _listener is not None:
+        _listener.stop()
@@ -3,23 +3,24 @@ from tkinter import messagebox
 import random
 
 def check_luck():
-    # Generate random number between 0 and 1
-    result = random.random()
-    
-    # 75% chance of losing (if result <= 0.75)
-    if result <= 0.75:
+    # Two random bits give 0-3; any non-zero value (75% chance) loses
+    if random.getrandbits(2):
         messagebox.showinfo("Result", "You lost!")
     else:
         messagebox.showinfo("Result", "You won!")
 
-# Create main window
-window = tk.Tk()
-window.title("Luck Game")
-window.geometry("200x100")
+def main():
+    # Create main window
+    window = tk.Tk()
+    window.title("Luck Game")
+    window.geometry("200x100")
 
-# Create and place button
-button = tk.Button(window, text="Good Luck!", command=check_luck)
-button.pack(expand=True)
+    # Create and place button
+    button = tk.Button(window, text="Good Luck!", command=check_luck)
+    button.pack(expand=True)
 
-# Start the application
-window.mainloop()
\ No newline at end of file
+    # Start the application
+    window.mainloop()
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
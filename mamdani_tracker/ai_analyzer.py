@@ -7,88 +7,47 @@ connecting policies to real-world effects, and minimizing bias through
 comprehensive multi-perspective analysis.
 """
 import os
+import asyncio
+import hashlib
+import random
+import threading
+import time
+from collections import OrderedDict
+import httpx
 from google import genai
-from google.genai import types
+from google.genai import errors, types
+from pydantic import BaseModel
 from datetime import datetime
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 import json
 
 
-class GeminiPromiseAnalyzer:
-    """
-    Uses Google Gemini for intelligent, nuanced analysis of:
-    - Whether news actually indicates real progress (not just announcements)
-    - Real-world impact vs. paper accomplishments
-    - Detecting stance changes and pragmatic adjustments
-    - Providing balanced multi-perspective views
-    """
+# Gemini calls a batch keeps in flight at once; beyond this the per-minute
+# quota starts answering 429 instead of overlapping work
+MAX_CONCURRENT_REQUESTS = 5
 
-    def __init__(self):
-        self.api_key = os.environ.get('GEMINI_API_KEY')
-        if not self.api_key:
-            raise ValueError("GEMINI_API_KEY environment variable not set")
-        
-        self.client = genai.Client(api_key=self.api_key)
-        self.model = "gemini-2.5-flash"
+# Gemini responses remembered per analyzer; the least recently used go first
+RESPONSE_CACHE_SIZE = 2048
 
-    def _make_request(self, prompt: str, system_instruction: str = None, 
-                      temperature: float = 0.3) -> Optional[str]:
-        """Make a request to Gemini API with error handling"""
-        try:
-            config = types.GenerateContentConfig(
-                temperature=temperature,
-                max_output_tokens=4000,
-            )
-            
-            if system_instruction:
-                config.system_instruction = system_instruction
-            
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=prompt,
-                config=config
-            )
-            return response.text
-        except Exception as e:
-            print(f"Gemini API error: {e}")
-            return None
+# Output token ceiling for requests that don't set their own. On
+# gemini-2.5-flash this budget also covers the model's thinking tokens,
+# so per-method ceilings leave room above the visible answer.
+DEFAULT_MAX_TOKENS = 4000
 
-    def _extract_json(self, text: str) -> Optional[Dict]:
-        """Extract JSON from response text, handling markdown code blocks"""
-        if not text:
-            return None
-        
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            if end > start:
-                text = text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            if end > start:
-                text = text[start:end].strip()
-        
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            start = text.find('{')
-            end = text.rfind('}') + 1
-            if start >= 0 and end > start:
-                try:
-                    return json.loads(text[start:end])
-                except json.JSONDecodeError:
-                    return None
-        return None
+# Attempts per Gemini call. Retry n waits min(RETRY_BASE_DELAY * 2**n,
+# RETRY_MAX_DELAY) seconds plus up to a second of jitter, so callers that
+# hit the per-minute quota together don't all come back at once
+MAX_ATTEMPTS = 4
+RETRY_BASE_DELAY = 0.5
+RETRY_MAX_DELAY = 8.0
 
-    def analyze_news_for_promise(self, news_content: str, news_source: str,
-                                  promise_title: str, promise_description: str,
-                                  current_status: str) -> Dict:
-        """
-        Analyze news with nuanced, real-world perspective.
-        Not just "is this relevant" but "what does this actually mean."
-        """
-        system_instruction = """You're a veteran NYC political analyst who's seen it all.
+# News items sent to Gemini in one batched prompt; keeps a batch's input
+# well inside the context window and its output under the token ceiling
+NEWS_BATCH_SIZE = 20
+
+# System instructions, one per kind of analysis. Kept at module level so
+# every call sends the identical string and the response cache keys on it
+_SYS_NEWS_ANALYST = """You're a veteran NYC political analyst who's seen it all.
         You know the difference between a press release and actual progress, between 
         an announcement and implementation, between political theater and real change.
         
@@ -103,19 +62,48 @@ class GeminiPromiseAnalyzer:
         
         Always respond with valid JSON only."""
 
-        prompt = f"""Analyze this news about Mayor Mamdani and give me the real assessment:
+_SYS_BATCH_ANALYST = """You're a seasoned political analyst who gives it to people straight.
+        You've covered NYC politics for years and you know how to separate signal from noise.
+        
+        Your job is to analyze this research and tell people what's actually happening with
+        each campaign promise - not the spin, not the attacks, just the honest assessment.
+        
+        For each promise, think about:
+        - Is there real progress or just talk?
+        - What would success actually look like and are we getting there?
+        - What are the real obstacles?
+        - Is the administration serious about this or is it back-burner?
+        
+        Be balanced but don't be wishy-washy. If something is working, say so. If it's not, say that too.
+        
+        Always respond with valid JSON only."""
 
-NEWS SOURCE: {news_source}
-NEWS CONTENT:
-{news_content}
+_SYS_SUMMARY_WRITER = """You're a straight-talking political reporter.
+        Write like you're explaining this to a smart friend over coffee - clear, honest, no jargon.
+        Don't be preachy or dramatic, just give people the real story in plain language."""
 
-CAMPAIGN PROMISE BEING TRACKED:
-Title: {promise_title}
-Description: {promise_description}
-Current Status: {current_status}
+_SYS_PERSPECTIVES = """You're committed to helping people understand all sides of an issue.
+        You believe that even when you have a personal view, people deserve to hear the strongest
+        version of arguments they might disagree with.
+        
+        Your job is to present multiple perspectives fairly and help people understand WHY
+        reasonable people might see this differently.
+        
+        Don't do false balance - if the evidence clearly points one way, say so. But on genuinely
+        contested issues, give voice to the range of legitimate views.
+        
+        Always respond with valid JSON only."""
 
-Give me the honest analysis in this JSON format:
-{{
+_SYS_FACT_CHECKER = """You're a political fact-checker who understands nuance.
+        You know that some "flip-flops" are actually reasonable adjustments to governing reality,
+        while others are genuine betrayals. Your job is to help people understand the difference.
+        
+        Be fair but honest. Politicians do have to adjust to reality once in office, but voters
+        deserve to know when promises are being abandoned vs. adapted vs. genuinely pursued.
+        
+        Always respond with valid JSON only."""
+
+_NEWS_ANALYSIS_FORMAT = """{
     "is_relevant": true or false,
     "relevance_score": 0.0 to 1.0,
     "relevance_reasoning": "Why this matters (or doesn't) for this promise",
@@ -142,13 +130,425 @@ Give me the honest analysis in this JSON format:
     "bias_notes": "Any spin or framing to be aware of",
     
     "frank_assessment": "Your honest, conversational take on what this means - talk like a real person"
-}}
+}"""
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Quota (429), server (5xx) and network failures are worth another try"""
+    if isinstance(error, errors.APIError):
+        code = error.code or 0
+        return code == 429 or code >= 500
+    return isinstance(error, (httpx.TimeoutException, httpx.NetworkError))
+
+
+def _retry_delay(attempt: int) -> float:
+    """Seconds to wait before retrying after the given zero-based attempt"""
+    return min(RETRY_BASE_DELAY * 2 ** attempt, RETRY_MAX_DELAY) + random.random()
 
-Return ONLY the JSON, no other text."""
 
-        result = self._make_request(prompt, system_instruction, temperature=0.4)
-        analysis = self._extract_json(result)
+def _finish_reason(response):
+    """Why Gemini stopped generating a response (or stream chunk), if it says"""
+    candidates = getattr(response, 'candidates', None)
+    return candidates[0].finish_reason if candidates else None
+
+
+def _is_cacheable(text: Optional[str], finish_reason, schema=None) -> bool:
+    """
+    Whether a response is a complete answer worth caching.
+    
+    Text cut off at the token ceiling or stopped for SAFETY or RECITATION
+    would otherwise be replayed for a whole GEMINI_CACHE_TTL, and so would
+    JSON-mode text that doesn't parse.
+    """
+    if text is None or finish_reason != types.FinishReason.STOP:
+        return False
+    if schema is not None:
+        try:
+            json.loads(text)
+        except json.JSONDecodeError:
+            return False
+    return True
+
+
+# Response schemas. Passed as response_schema so Gemini returns JSON of
+# exactly this shape; the prompts still describe what each field means.
+
+class NewsAnalysis(BaseModel):
+    is_relevant: bool
+    relevance_score: float
+    relevance_reasoning: str
+    substance_assessment: str
+    substance_explanation: str
+    indicates_status_change: bool
+    suggested_new_status: Optional[str]
+    status_reasoning: str
+    real_world_impact: str
+    implementation_likelihood: float
+    implementation_obstacles: str
+    stance_change_detected: bool
+    stance_change_type: str
+    stance_change_details: str
+    sentiment: str
+    confidence: float
+    bias_in_source: str
+    bias_notes: str
+    frank_assessment: str
+
+
+class NewsBatchItem(NewsAnalysis):
+    item_number: int
+
+
+class PromiseAnalysis(BaseModel):
+    promise_number: int
+    promise_title: str
+    is_mentioned: bool
+    relevance_score: float
+    current_evidence: str
+    real_vs_announced: str
+    suggested_status: str
+    status_confidence: float
+    status_reasoning: str
+    implementation_reality: str
+    key_obstacles: str
+    stance_change: bool
+    stance_change_type: str
+    stance_change_details: str
+    frank_take: str
+
+
+class BatchAnalysis(BaseModel):
+    analysis_timestamp: str
+    overall_assessment: str
+    promises_analyzed: List[PromiseAnalysis]
+    biggest_wins: List[str]
+    biggest_concerns: List[str]
+    things_to_watch: List[str]
+    notable_stance_changes: List[str]
+    promises_not_mentioned: List[int]
+
+
+class AdministrationView(BaseModel):
+    position: str
+    strongest_argument: str
+    evidence_cited: str
+
+
+class PoliticalView(BaseModel):
+    position: str
+    strongest_argument: str
+    concerns: str
+
+
+class AffectedCommunities(BaseModel):
+    who: str
+    what_theyre_saying: str
+    key_concerns: str
+
+
+class ExpertConsensus(BaseModel):
+    what_experts_say: str
+    key_evidence: str
+    uncertainties: str
+
+
+class Synthesis(BaseModel):
+    where_sides_agree: str
+    core_disagreement: str
+    my_assessment: str
+    what_to_watch: str
+
+
+class BalancedPerspective(BaseModel):
+    topic: str
+    administration_view: AdministrationView
+    progressive_view: PoliticalView
+    moderate_view: PoliticalView
+    conservative_view: PoliticalView
+    affected_communities: AffectedCommunities
+    expert_consensus: ExpertConsensus
+    synthesis: Synthesis
+
+
+class CampaignComparison(BaseModel):
+    promise_kept: str
+    consistency_score: float
+    what_was_promised: str
+    what_is_happening: str
+    the_gap: str
+    gap_type: str
+    is_this_reasonable: bool
+    reasonableness_explanation: str
+    fulfillment_evidence: List[str]
+    breaking_evidence: List[str]
+    adjustment_evidence: List[str]
+    who_benefits: str
+    who_loses: str
+    frank_assessment: str
+    confidence: float
+
+
+class GeminiPromiseAnalyzer:
+    """
+    Uses Google Gemini for intelligent, nuanced analysis of:
+    - Whether news actually indicates real progress (not just announcements)
+    - Real-world impact vs. paper accomplishments
+    - Detecting stance changes and pragmatic adjustments
+    - Providing balanced multi-perspective views
+    """
+
+    def __init__(self):
+        self.api_key = os.environ.get('GEMINI_API_KEY')
+        if not self.api_key:
+            raise ValueError("GEMINI_API_KEY environment variable not set")
         
+        self.client = genai.Client(api_key=self.api_key)
+        self.model = "gemini-2.5-flash"
+
+        # Re-runs, retries and dashboard refreshes send identical prompts;
+        # answer those from memory for GEMINI_CACHE_TTL seconds
+        self.cache_ttl = int(os.environ.get('GEMINI_CACHE_TTL', 86400))
+        self._response_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _cache_key(self, prompt: str, system_instruction: Optional[str],
+                   temperature: float, max_tokens: int, schema=None) -> str:
+        """Hash everything that shapes a response, including its schema, into a cache key"""
+        key_data = (f"{system_instruction or ''}\x00{prompt}\x00{temperature}"
+                    f"\x00{max_tokens}\x00{schema!r}")
+        return hashlib.blake2b(key_data.encode('utf-8'), digest_size=16).hexdigest()
+
+    def _cache_get(self, key: str) -> Optional[str]:
+        """Return a cached response that hasn't expired"""
+        with self._cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            text, expires_at = entry
+            if time.monotonic() >= expires_at:
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            return text
+
+    def _cache_put(self, key: str, text: str):
+        """Remember a response, evicting the least recently used past the cap"""
+        with self._cache_lock:
+            self._response_cache[key] = (text, time.monotonic() + self.cache_ttl)
+            self._response_cache.move_to_end(key)
+            while len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def flush_cache(self):
+        """Forget every cached response"""
+        with self._cache_lock:
+            self._response_cache.clear()
+
+    def _build_config(self, system_instruction: str = None,
+                      temperature: float = 0.3,
+                      max_tokens: int = DEFAULT_MAX_TOKENS,
+                      schema=None) -> types.GenerateContentConfig:
+        """
+        Build the generation config shared by sync and async requests.
+        
+        With a schema, Gemini's JSON mode returns bare JSON of that shape.
+        """
+        config = types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+        )
+        
+        if system_instruction:
+            config.system_instruction = system_instruction
+        
+        if schema is not None:
+            config.response_mime_type = "application/json"
+            config.response_schema = schema
+        
+        return config
+
+    def _make_request(self, prompt: str, system_instruction: str = None, 
+                      temperature: float = 0.3, max_tokens: int = DEFAULT_MAX_TOKENS,
+                      schema=None, no_cache: bool = False) -> Optional[str]:
+        """
+        Make a request to Gemini API with error handling.
+        
+        Rate limits, server errors and timeouts are retried with backoff;
+        other errors such as bad keys or invalid requests fail at once.
+        Identical requests are answered from the response cache unless
+        no_cache is set. Only complete responses are cached: errors,
+        truncated or blocked output and unparseable JSON are not.
+        """
+        key = self._cache_key(prompt, system_instruction, temperature, max_tokens, schema)
+        if not no_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        config = self._build_config(system_instruction, temperature, max_tokens, schema)
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                response = self.client.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=config
+                )
+                break
+            except Exception as e:
+                if attempt + 1 < MAX_ATTEMPTS and _is_retryable(e):
+                    time.sleep(_retry_delay(attempt))
+                    continue
+                print(f"Gemini API error: {e}")
+                return None
+
+        if _is_cacheable(response.text, _finish_reason(response), schema):
+            self._cache_put(key, response.text)
+        return response.text
+
+    async def _make_request_async(self, aclient, prompt: str,
+                                  system_instruction: str = None,
+                                  temperature: float = 0.3,
+                                  max_tokens: int = DEFAULT_MAX_TOKENS,
+                                  schema=None,
+                                  no_cache: bool = False) -> Optional[str]:
+        """Make a request on an async Gemini client; shares the retries and response cache"""
+        key = self._cache_key(prompt, system_instruction, temperature, max_tokens, schema)
+        if not no_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                return cached
+
+        config = self._build_config(system_instruction, temperature, max_tokens, schema)
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                response = await aclient.models.generate_content(
+                    model=self.model,
+                    contents=prompt,
+                    config=config
+                )
+                break
+            except Exception as e:
+                if attempt + 1 < MAX_ATTEMPTS and _is_retryable(e):
+                    await asyncio.sleep(_retry_delay(attempt))
+                    continue
+                print(f"Gemini API error: {e}")
+                return None
+
+        if _is_cacheable(response.text, _finish_reason(response), schema):
+            self._cache_put(key, response.text)
+        return response.text
+
+    def _make_request_stream(self, prompt: str, system_instruction: str = None,
+                             temperature: float = 0.3,
+                             max_tokens: int = DEFAULT_MAX_TOKENS,
+                             no_cache: bool = False) -> Iterator[str]:
+        """
+        Stream a response's text as Gemini generates it.
+        
+        Yields nothing if the request fails. A failure before the first chunk
+        is retried like _make_request; once text has been yielded a retry
+        would repeat it, so the stream just ends. Text from a stream that
+        finished normally goes into the response cache, and a cached response
+        is yielded as a single chunk.
+        """
+        key = self._cache_key(prompt, system_instruction, temperature, max_tokens)
+        if not no_cache:
+            cached = self._cache_get(key)
+            if cached is not None:
+                yield cached
+                return
+
+        config = self._build_config(system_instruction, temperature, max_tokens)
+        parts = []
+        finish_reason = None
+        for attempt in range(MAX_ATTEMPTS):
+            try:
+                for chunk in self.client.models.generate_content_stream(
+                    model=self.model,
+                    contents=prompt,
+                    config=config
+                ):
+                    finish_reason = _finish_reason(chunk) or finish_reason
+                    if chunk.text:
+                        parts.append(chunk.text)
+                        yield chunk.text
+                break
+            except Exception as e:
+                if not parts and attempt + 1 < MAX_ATTEMPTS and _is_retryable(e):
+                    time.sleep(_retry_delay(attempt))
+                    continue
+                print(f"Gemini API error: {e}")
+                return
+
+        text = "".join(parts)
+        if parts and _is_cacheable(text, finish_reason):
+            self._cache_put(key, text)
+
+    def _load_json(self, text: Optional[str]) -> Optional[Dict]:
+        """Parse a JSON-mode response, which needs no fence stripping"""
+        if not text:
+            return None
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            # Only happens when the output hit its token ceiling mid-object;
+            # such responses are never cached, so the next call asks again
+            return None
+
+    def _build_news_request(self, news_content: str, news_source: str,
+                            promise_title: str, promise_description: str,
+                            current_status: str) -> tuple:
+        """Build the (system_instruction, prompt) pair for one news analysis"""
+        system_instruction = _SYS_NEWS_ANALYST
+
+        prompt = f"""Analyze this news about Mayor Mamdani and give me the real assessment:
+
+NEWS SOURCE: {news_source}
+NEWS CONTENT:
+{news_content}
+
+CAMPAIGN PROMISE BEING TRACKED:
+Title: {promise_title}
+Description: {promise_description}
+Current Status: {current_status}
+
+Give me the honest analysis in this JSON format:
+{_NEWS_ANALYSIS_FORMAT}
+
+Return ONLY the JSON, no other text."""
+
+        return system_instruction, prompt
+
+    def _build_news_batch_request(self, items: List[Dict]) -> tuple:
+        """Build the (system_instruction, prompt) pair analyzing several news items at once"""
+        item_blocks = "\n\n".join(
+            f"""ITEM {i}
+NEWS SOURCE: {item['news_source']}
+NEWS CONTENT:
+{item['news_content']}
+
+CAMPAIGN PROMISE BEING TRACKED:
+Title: {item['promise_title']}
+Description: {item['promise_description']}
+Current Status: {item['current_status']}"""
+            for i, item in enumerate(items, 1)
+        )
+
+        prompt = f"""Analyze each of these {len(items)} news items about Mayor Mamdani against the campaign promise it's paired with, and give me the real assessment of each:
+
+{item_blocks}
+
+Return a JSON array with one object per item, in item order. Each object has
+"item_number" (the ITEM number above) plus the fields of this format:
+{_NEWS_ANALYSIS_FORMAT}
+
+Return ONLY the JSON array, no other text."""
+
+        return _SYS_NEWS_ANALYST, prompt
+
+    def _news_analysis_result(self, analysis: Optional[Dict], promise_title: str,
+                              raw_response: Optional[str]) -> Dict:
+        """Turn a parsed news analysis into the result dict"""
         if analysis:
             analysis['timestamp'] = datetime.utcnow().isoformat()
             analysis['promise_title'] = promise_title
@@ -158,11 +558,89 @@ Return ONLY the JSON, no other text."""
         return {
             'success': False,
             'error': 'Failed to parse response',
-            'raw_response': result
+            'raw_response': raw_response
         }
 
+    def analyze_news_for_promise(self, news_content: str, news_source: str,
+                                  promise_title: str, promise_description: str,
+                                  current_status: str, no_cache: bool = False) -> Dict:
+        """
+        Analyze news with nuanced, real-world perspective.
+        Not just "is this relevant" but "what does this actually mean."
+        """
+        system_instruction, prompt = self._build_news_request(
+            news_content, news_source, promise_title,
+            promise_description, current_status
+        )
+        result = self._make_request(prompt, system_instruction, temperature=0.4,
+                                    max_tokens=2048, schema=NewsAnalysis,
+                                    no_cache=no_cache)
+        return self._news_analysis_result(self._load_json(result), promise_title, result)
+
+    def analyze_news_batch(self, items: List[Dict], no_cache: bool = False) -> List[Dict]:
+        """
+        Analyze many news items with a few batched Gemini calls.
+        
+        Each item holds the keyword arguments of analyze_news_for_promise.
+        Items go NEWS_BATCH_SIZE to a prompt, so the system instruction and
+        schema are sent once per chunk rather than once per item, and the
+        chunks run concurrently. Results come back in the same order as items.
+        
+        This entry point is for synchronous callers only: it runs its own
+        event loop with asyncio.run. Code already inside a running loop should
+        await analyze_news_batch_async instead.
+        """
+        if not items:
+            return []
+        return asyncio.run(self.analyze_news_batch_async(items, no_cache))
+
+    async def analyze_news_batch_async(self, items: List[Dict],
+                                       no_cache: bool = False) -> List[Dict]:
+        """
+        Async form of analyze_news_batch, for callers with a running event loop.
+        
+        Runs MAX_CONCURRENT_REQUESTS chunks at a time.
+        """
+        if not items:
+            return []
+
+        # A fresh client per batch, closed when the batch ends: its async HTTP
+        # pool belongs to the event loop that is running now
+        async with genai.Client(api_key=self.api_key).aio as aclient:
+            return await self._analyze_news_chunks(aclient, items, no_cache)
+
+    async def _analyze_news_chunks(self, aclient, items: List[Dict],
+                                   no_cache: bool) -> List[Dict]:
+        """Analyze items NEWS_BATCH_SIZE to a request on an open async client"""
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+        async def analyze(chunk: List[Dict]) -> List[Dict]:
+            system_instruction, prompt = self._build_news_batch_request(chunk)
+            async with semaphore:
+                result = await self._make_request_async(
+                    aclient, prompt, system_instruction, temperature=0.4,
+                    # ~1K visible tokens per item plus one thinking allowance
+                    max_tokens=1024 * len(chunk) + 2048,
+                    schema=List[NewsBatchItem], no_cache=no_cache
+                )
+            analyses = self._load_json(result)
+            by_number = {}
+            if isinstance(analyses, list):
+                by_number = {a.pop('item_number', None): a
+                             for a in analyses if isinstance(a, dict)}
+            return [
+                self._news_analysis_result(by_number.get(i), item['promise_title'], result)
+                for i, item in enumerate(chunk, 1)
+            ]
+
+        chunks = [items[i:i + NEWS_BATCH_SIZE]
+                  for i in range(0, len(items), NEWS_BATCH_SIZE)]
+        results = await asyncio.gather(*(analyze(chunk) for chunk in chunks))
+        return [analysis for chunk_results in results for analysis in chunk_results]
+
     def batch_analyze_research_results(self, research_content: str, 
-                                        promises: List[Dict]) -> Dict:
+                                        promises: List[Dict],
+                                        no_cache: bool = False) -> Dict:
         """
         Analyze research results with nuanced, comprehensive perspective.
         """
@@ -171,21 +649,7 @@ Return ONLY the JSON, no other text."""
             for i, p in enumerate(promises)
         ])
 
-        system_instruction = """You're a seasoned political analyst who gives it to people straight.
-        You've covered NYC politics for years and you know how to separate signal from noise.
-        
-        Your job is to analyze this research and tell people what's actually happening with
-        each campaign promise - not the spin, not the attacks, just the honest assessment.
-        
-        For each promise, think about:
-        - Is there real progress or just talk?
-        - What would success actually look like and are we getting there?
-        - What are the real obstacles?
-        - Is the administration serious about this or is it back-burner?
-        
-        Be balanced but don't be wishy-washy. If something is working, say so. If it's not, say that too.
-        
-        Always respond with valid JSON only."""
+        system_instruction = _SYS_BATCH_ANALYST
 
         prompt = f"""Analyze this research against the campaign promises and give me the real story:
 
@@ -236,8 +700,10 @@ Return JSON in this format:
 
 Return ONLY the JSON, no other text."""
 
-        result = self._make_request(prompt, system_instruction, temperature=0.4)
-        analysis = self._extract_json(result)
+        result = self._make_request(prompt, system_instruction, temperature=0.4,
+                                    max_tokens=4000, schema=BatchAnalysis,
+                                    no_cache=no_cache)
+        analysis = self._load_json(result)
         
         if analysis:
             analysis['success'] = True
@@ -249,16 +715,10 @@ Return ONLY the JSON, no other text."""
             'raw_response': result
         }
 
-    def generate_promise_update_summary(self, promise: Dict, 
-                                         new_evidence: str,
-                                         old_status: str,
-                                         new_status: str) -> str:
-        """
-        Generate a frank, human-readable summary of a promise update.
-        """
-        system_instruction = """You're a straight-talking political reporter.
-        Write like you're explaining this to a smart friend over coffee - clear, honest, no jargon.
-        Don't be preachy or dramatic, just give people the real story in plain language."""
+    def _build_summary_request(self, promise: Dict, new_evidence: str,
+                               old_status: str, new_status: str) -> tuple:
+        """Build the (system_instruction, prompt) pair for an update summary"""
+        system_instruction = _SYS_SUMMARY_WRITER
 
         prompt = f"""Write a brief, frank summary of this promise update:
 
@@ -274,24 +734,53 @@ Write 2-3 sentences that tell people what actually happened and what it means.
 Be honest - if this is a big deal, say so. If it's mostly symbolic, say that too.
 Talk like a real person, not a press release."""
 
-        result = self._make_request(prompt, system_instruction, temperature=0.5)
-        return result or "Status update recorded."
+        return system_instruction, prompt
 
-    def get_balanced_perspective(self, topic: str, context: str) -> Dict:
+    def generate_promise_update_summary(self, promise: Dict, 
+                                         new_evidence: str,
+                                         old_status: str,
+                                         new_status: str,
+                                         no_cache: bool = False) -> str:
         """
-        Get a balanced, multi-perspective view on a topic to minimize bias.
+        Generate a frank, human-readable summary of a promise update.
         """
-        system_instruction = """You're committed to helping people understand all sides of an issue.
-        You believe that even when you have a personal view, people deserve to hear the strongest
-        version of arguments they might disagree with.
-        
-        Your job is to present multiple perspectives fairly and help people understand WHY
-        reasonable people might see this differently.
+        system_instruction, prompt = self._build_summary_request(
+            promise, new_evidence, old_status, new_status
+        )
+        result = self._make_request(prompt, system_instruction, temperature=0.5,
+                                    max_tokens=1024, no_cache=no_cache)
+        return result or "Status update recorded."
+
+    def stream_promise_update_summary(self, promise: Dict,
+                                      new_evidence: str,
+                                      old_status: str,
+                                      new_status: str,
+                                      no_cache: bool = False) -> Iterator[str]:
+        """
+        Stream the same summary as generate_promise_update_summary.
         
-        Don't do false balance - if the evidence clearly points one way, say so. But on genuinely
-        contested issues, give voice to the range of legitimate views.
+        Text is yielded as it is generated so a UI can show it right away
+        instead of waiting for the whole response.
+        """
+        system_instruction, prompt = self._build_summary_request(
+            promise, new_evidence, old_status, new_status
+        )
+        produced = False
+        for text in self._make_request_stream(prompt, system_instruction,
+                                              temperature=0.5, max_tokens=1024,
+                                              no_cache=no_cache):
+            produced = True
+            yield text
         
-        Always respond with valid JSON only."""
+        if not produced:
+            yield "Status update recorded."
+
+    def get_balanced_perspective(self, topic: str, context: str,
+                                 no_cache: bool = False) -> Dict:
+        """
+        Get a balanced, multi-perspective view on a topic to minimize bias.
+        """
+        system_instruction = _SYS_PERSPECTIVES
 
         prompt = f"""Give me the full picture on this topic:
 
@@ -348,8 +837,10 @@ Present the range of perspectives in this JSON format:
 
 Return ONLY the JSON, no other text."""
 
-        result = self._make_request(prompt, system_instruction, temperature=0.4)
-        analysis = self._extract_json(result)
+        result = self._make_request(prompt, system_instruction, temperature=0.4,
+                                    max_tokens=3072, schema=BalancedPerspective,
+                                    no_cache=no_cache)
+        analysis = self._load_json(result)
         
         if analysis:
             analysis['success'] = True
@@ -363,18 +854,12 @@ Return ONLY the JSON, no other text."""
 
     def compare_campaign_vs_current_position(self, promise_title: str,
                                               campaign_position: str,
-                                              current_evidence: str) -> Dict:
+                                              current_evidence: str,
+                                              no_cache: bool = False) -> Dict:
         """
         Compare campaign promises to current reality with nuanced assessment.
         """
-        system_instruction = """You're a political fact-checker who understands nuance.
-        You know that some "flip-flops" are actually reasonable adjustments to governing reality,
-        while others are genuine betrayals. Your job is to help people understand the difference.
-        
-        Be fair but honest. Politicians do have to adjust to reality once in office, but voters
-        deserve to know when promises are being abandoned vs. adapted vs. genuinely pursued.
-        
-        Always respond with valid JSON only."""
+        system_instruction = _SYS_FACT_CHECKER
 
         prompt = f"""Compare what was promised vs. what's happening:
 
@@ -413,8 +898,10 @@ Give me the honest comparison in this JSON format:
 
 Return ONLY the JSON, no other text."""
 
-        result = self._make_request(prompt, system_instruction, temperature=0.4)
-        analysis = self._extract_json(result)
+        result = self._make_request(prompt, system_instruction, temperature=0.4,
+                                    max_tokens=2048, schema=CampaignComparison,
+                                    no_cache=no_cache)
+        analysis = self._load_json(result)
         
         if analysis:
             analysis['timestamp'] = datetime.utcnow().isoformat()